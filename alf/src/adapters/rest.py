@@ -1,6 +1,12 @@
 import logging
-from datetime import datetime
-from typing import Any, Optional
+import re
+from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterator, Optional
 
 from src.adapters.base import BaseAdapter
 from src.models import AuctionRecord
@@ -10,19 +16,37 @@ log = logging.getLogger(__name__)
 # Wrapper keys to try when the response is a dict rather than a bare list
 _WRAPPER_KEYS = ("itemSummaries", "vehicles", "listings", "results", "data", "lots", "auctions", "items", "records")
 
+# Currency assumed when a site does not report one
+_DEFAULT_CURRENCY = "GBP"
+
+# Non-ISO date shapes accepted by _to_date: D/M/Y or M/D/Y ("/"), D-M-Y ("-"),
+# and compact YYYYMMDD. Matched once instead of trying strptime per format.
+_DATE_RE = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4})|(\d{4})(\d{2})(\d{2})")
+
 
 # ---------------------------------------------------------------------------
 # Module-level parse helpers (shared with classifieds adapter)
 # ---------------------------------------------------------------------------
 
-def _get_field(item: dict, mapping: dict, canonical: str) -> Any:
-    """Extract canonical field value from item using dot-notation paths."""
-    path = mapping.get(canonical)
-    if not path:
+@lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-notation path into a tuple of keys (cached per distinct path)."""
+    return tuple(path.split("."))
+
+
+def _compile_mapping(mapping: dict[str, Optional[str]]) -> dict[str, tuple[str, ...]]:
+    """Pre-split each non-null field_mapping path into its tuple of keys."""
+    return {canonical: _split_path(path) for canonical, path in mapping.items() if path}
+
+
+def _walk(item: dict, parts: Optional[tuple[str, ...]]) -> Any:
+    """Follow pre-split dot-notation parts into item; None if any hop is missing."""
+    if not parts:
         return None
     val: Any = item
-    for part in path.split("."):
-        if not isinstance(val, dict):
+    for part in parts:
+        # Exact type check: decoded JSON objects are always plain dicts.
+        if type(val) is not dict:
             return None
         val = val.get(part)
     return val
@@ -31,28 +55,85 @@ def _get_field(item: dict, mapping: dict, canonical: str) -> Any:
 def _to_float(v: Any) -> Optional[float]:
     if v is None:
         return None
+    # Decoded JSON numbers are already float/int; skip the try/except path.
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
     try:
         return float(v)
     except (TypeError, ValueError):
         return None
 
 
+def _to_title(v: Any) -> str:
+    """Strip and title-case a name field; "" when the field is missing or empty."""
+    if not v:
+        return ""
+    return str(v).strip().title()
+
+
+def _to_currency(v: Any) -> str:
+    """Upper-case ISO 4217 code, defaulting to GBP when the field is missing."""
+    if not v:
+        return _DEFAULT_CURRENCY
+    return str(v).upper()
+
+
+def _iso_date(year: int, month: int, day: int) -> Optional[str]:
+    """Format a calendar date as YYYY-MM-DD, or None if it does not exist."""
+    if year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]:
+        return f"{year:04d}-{month:02d}-{day:02d}"
+    return None
+
+
 def _to_date(v: Any, source: str = "") -> Optional[str]:
     if v is None:
         return None
     s = str(v)
     if len(s) >= 10 and s[4] == "-" and s[7] == "-":
         return s[:10]
-    for fmt in ("%d/%m/%Y", "%m/%d/%Y", "%Y%m%d", "%d-%m-%Y"):
-        try:
-            return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+    m = _DATE_RE.fullmatch(s)
+    if m:
+        first, sep, second, year, c_year, c_month, c_day = m.groups()
+        if c_year is not None:
+            iso = _iso_date(int(c_year), int(c_month), int(c_day))
+        else:
+            # Day-first wins; "/" dates fall back to US month-first order.
+            iso = _iso_date(int(year), int(second), int(first))
+            if iso is None and sep == "/":
+                iso = _iso_date(int(year), int(first), int(second))
+        if iso is not None:
+            return iso
     if source:
         log.debug("[%s] could not parse date %r — storing as-is", source, s)
     return s
 
 
+@dataclass(frozen=True, slots=True)
+class _Pagination:
+    """A site's "pagination" block, resolved once with defaults applied."""
+
+    type: str                  = "none"
+    page_param: str            = "page"
+    page_size_param: str       = "page_size"
+    page_size: Optional[int]   = None
+    start_page: int            = 1
+    # offset_step=1  → traditional page-number APIs (page 1, 2, 3…)
+    # offset_step=N  → direct item-offset APIs like eBay (offset 0, 200, 400…)
+    offset_step: int           = 1
+    concurrency: int           = 1
+    cursor_param: str          = "cursor"
+    cursor_response_field: str = "next_cursor"
+    max_pages: int             = 1000
+
+    @classmethod
+    def from_config(cls, pagination: dict[str, Any]) -> "_Pagination":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in pagination.items() if k in known})
+
+
 class RestAdapter(BaseAdapter):
     """
     Generic REST adapter for sites that return JSON arrays of auction objects.
@@ -67,19 +148,30 @@ class RestAdapter(BaseAdapter):
 
     Both pagination types support an optional "max_pages" key (default 1000)
     to guard against runaway loops on misbehaving APIs.
+
+    Offset pagination also accepts an optional "concurrency" key (default 1).
+    Values above 1 prefetch that many pages at a time on a small thread pool;
+    pages are still consumed in order, so a short or empty page stops the loop
+    exactly as in the serial case (at the cost of up to concurrency-1 wasted
+    speculative requests at the end).
     """
 
     name = "rest"
+    # Noun used in per-item log messages
+    _record_label = "record"
 
     def __init__(self, site_config: dict[str, Any], fetcher: Any) -> None:
         super().__init__(site_config, fetcher)
         # Pre-compute once at construction; field_mapping never changes at runtime.
         self._field_mapping: dict[str, str] = site_config.get("field_mapping", {})
+        # Dot-notation paths split once here rather than once per field per record.
+        self._field_paths: dict[str, tuple[str, ...]] = _compile_mapping(self._field_mapping)
         # Top-level keys whose values appear in field_mapping paths — excluded from raw{}.
         # frozenset for O(1) `in` checks inside _map_item.
         self._mapped_top_keys: frozenset[str] = frozenset(
-            v.split(".")[0] for v in self._field_mapping.values() if v
+            parts[0] for parts in self._field_paths.values()
         )
+        self._pagination = _Pagination.from_config(site_config.get("pagination", {}))
 
     def fetch(self) -> list[AuctionRecord]:
         """
@@ -89,14 +181,13 @@ class RestAdapter(BaseAdapter):
         endpoint = self.config["endpoints"]["auctions"]
         url      = self.config["base_url"].rstrip("/") + endpoint
         params   = dict(self.config.get("default_params", {}))
-        pagination = self.config.get("pagination", {})
-        pag_type   = pagination.get("type", "none")
+        pag_type = self._pagination.type
 
         try:
             if pag_type == "offset":
-                return self._fetch_offset(url, params, pagination)
+                return self._fetch_offset(url, params, self._pagination)
             elif pag_type == "cursor":
-                return self._fetch_cursor(url, params, pagination)
+                return self._fetch_cursor(url, params, self._pagination)
             else:
                 raw = self.fetcher.get(url, params=params)
                 return self.parse(raw)
@@ -111,16 +202,31 @@ class RestAdapter(BaseAdapter):
         raw_response may be a list of dicts or a dict wrapping a list.
         """
         source  = self.config["name"]
-        records = []
+        records = self._map_items(self._unwrap(raw_response), source)
+        log.debug("[%s] parsed %d records", source, len(records))
+        return records
 
-        items = self._unwrap(raw_response)
+    def _map_items(self, items: list[dict], source: str) -> list[Any]:
+        """
+        Map every item on a page, skipping (and logging) malformed ones.
+
+        Pages are normally clean, so the whole page is mapped in one pass with
+        no per-item handler; only if that raises is the page re-mapped item by
+        item to isolate and log the bad records.
+        """
+        paths = self._field_paths
+        try:
+            return [self._map_item(item, paths, source) for item in items]
+        except Exception:
+            pass
+
+        records = []
         for item in items:
             try:
-                records.append(self._map_item(item, self._field_mapping, source))
+                records.append(self._map_item(item, paths, source))
             except Exception as exc:
-                log.warning("[%s] skipping malformed record: %s — %r", source, exc, item)
-
-        log.debug("[%s] parsed %d records", source, len(records))
+                log.warning("[%s] skipping malformed %s: %s — %r",
+                            source, self._record_label, exc, item)
         return records
 
     # ------------------------------------------------------------------
@@ -131,53 +237,86 @@ class RestAdapter(BaseAdapter):
         self,
         url: str,
         base_params: dict[str, Any],
-        pagination: dict[str, Any],
+        pag: _Pagination,
     ) -> list[AuctionRecord]:
-        page_param      = pagination.get("page_param", "page")
-        page_size_param = pagination.get("page_size_param", "page_size")
-        offset          = pagination.get("start_page", 1)
         # Prefer an explicit page_size key; fall back to reading it from default_params
-        page_size       = pagination.get("page_size") or base_params.get(page_size_param, 100)
-        # offset_step=1  → traditional page-number APIs (page 1, 2, 3…)
-        # offset_step=N  → direct item-offset APIs like eBay (offset 0, 200, 400…)
-        step            = pagination.get("offset_step", 1)
-        max_pages       = pagination.get("max_pages", 1000)
+        page_size   = pag.page_size or base_params.get(pag.page_size_param, 100)
+        max_pages   = pag.max_pages
+        concurrency = max(1, int(pag.concurrency))
         all_records: list[AuctionRecord] = []
         page_count = 0
 
-        while True:
-            params = {**base_params, page_param: offset}
-            raw    = self.fetcher.get(url, params=params)
-            batch  = self.parse(raw)
-            page_count += 1
-
-            if not batch:
-                break
-
-            all_records.extend(batch)
-
-            if len(batch) < page_size or page_count >= max_pages:
-                if page_count >= max_pages and len(batch) >= page_size:
-                    log.warning(
-                        "[%s] offset pagination hit max_pages=%d — stopping",
-                        self.config["name"], max_pages,
-                    )
-                break
-            offset += step
+        # closing() stops any in-flight prefetch as soon as the loop breaks
+        with closing(self._offset_pages(
+            url, base_params, pag.page_param, pag.start_page, pag.offset_step,
+            max_pages, concurrency,
+        )) as pages:
+            for raw in pages:
+                batch  = self.parse(raw)
+                # Drop the decoded page now so only its records outlive this
+                # iteration; otherwise it stays alive across the next fetch.
+                del raw
+                page_count += 1
+
+                if not batch:
+                    break
+
+                all_records.extend(batch)
+
+                if len(batch) < page_size or page_count >= max_pages:
+                    if page_count >= max_pages and len(batch) >= page_size:
+                        log.warning(
+                            "[%s] offset pagination hit max_pages=%d — stopping",
+                            self.config["name"], max_pages,
+                        )
+                    break
 
         log.debug("[%s] offset pagination: %d total records across %d pages",
                   self.config["name"], len(all_records), page_count)
         return all_records
 
+    def _offset_pages(
+        self,
+        url: str,
+        base_params: dict[str, Any],
+        page_param: str,
+        start: int,
+        step: int,
+        max_pages: int,
+        concurrency: int,
+    ) -> Iterator[Any]:
+        """
+        Yield raw page responses in offset order, at most max_pages of them.
+
+        With concurrency > 1 the next `concurrency` pages are requested in
+        parallel; the Fetcher's TokenBucket still caps the request rate.
+        Closing the generator early discards any unconsumed prefetched pages.
+        """
+        def _get(page_offset: int) -> Any:
+            return self.fetcher.get(url, params={**base_params, page_param: page_offset})
+
+        offsets = (start + i * step for i in range(max_pages))
+        if concurrency == 1:
+            for page_offset in offsets:
+                yield _get(page_offset)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix=f"alf-{self.config['name']}-page",
+        ) as executor:
+            while window := list(islice(offsets, concurrency)):
+                yield from executor.map(_get, window)
+
     def _fetch_cursor(
         self,
         url: str,
         base_params: dict[str, Any],
-        pagination: dict[str, Any],
+        pag: _Pagination,
     ) -> list[AuctionRecord]:
-        cursor_param          = pagination.get("cursor_param", "cursor")
-        cursor_response_field = pagination.get("cursor_response_field", "next_cursor")
-        max_pages             = pagination.get("max_pages", 1000)
+        cursor_param          = pag.cursor_param
+        cursor_response_field = pag.cursor_response_field
+        max_pages             = pag.max_pages
         params                = dict(base_params)
         all_records: list[AuctionRecord] = []
         page_count = 0
@@ -185,6 +324,10 @@ class RestAdapter(BaseAdapter):
         while True:
             raw    = self.fetcher.get(url, params=params)
             batch  = self.parse(raw)
+            # Extract next cursor from the response dict, then release the
+            # decoded page before the next request is issued.
+            next_cursor = raw.get(cursor_response_field) if isinstance(raw, dict) else None
+            del raw
             all_records.extend(batch)
             page_count += 1
 
@@ -195,14 +338,11 @@ class RestAdapter(BaseAdapter):
                 )
                 break
 
-            # Extract next cursor from the response dict
-            next_cursor = None
-            if isinstance(raw, dict):
-                next_cursor = raw.get(cursor_response_field)
-
             if not next_cursor:
                 break
-            params = {**base_params, cursor_param: next_cursor}
+            # Cursor pages are strictly sequential, so one params dict is
+            # reused; requests copies it into the URL on every call.
+            params[cursor_param] = next_cursor
 
         log.debug("[%s] cursor pagination: %d total records across %d pages",
                   self.config["name"], len(all_records), page_count)
@@ -217,41 +357,43 @@ class RestAdapter(BaseAdapter):
         if isinstance(raw, list):
             return raw
         if isinstance(raw, dict):
+            # Keep _WRAPPER_KEYS priority order; one .get per key instead of
+            # an `in` probe followed by a second lookup on hit.
             for key in _WRAPPER_KEYS:
-                if key in raw and isinstance(raw[key], list):
-                    return raw[key]
+                val = raw.get(key)
+                if type(val) is list:
+                    return val
         log.warning("[%s] unexpected response shape: %r", self.config["name"], type(raw))
         return []
 
     def _map_item(
         self,
         item: dict[str, Any],
-        mapping: dict[str, str],
+        paths: dict[str, tuple[str, ...]],
         source: str,
     ) -> AuctionRecord:
-        """Apply field_mapping to a single auction dict, returning an AuctionRecord.
+        """Apply compiled field paths to a single auction dict, returning an AuctionRecord.
 
-        field_mapping values support dot-notation for nested fields,
-        e.g. "currentBidPrice.value" extracts item["currentBidPrice"]["value"].
-        The top-level key of any mapped path is excluded from raw{}.
+        paths is the output of _compile_mapping(field_mapping): dot-notation
+        fields arrive pre-split, e.g. "currentBidPrice.value" becomes
+        ("currentBidPrice", "value"). The top-level key of any mapped path
+        is excluded from raw{}.
         """
-        def _get(canonical: str) -> Any:
-            return _get_field(item, mapping, canonical)
-
+        get = paths.get
         raw = {k: v for k, v in item.items() if k not in self._mapped_top_keys}
 
-        _lot = _get("lot_id")
+        _lot = _walk(item, get("lot_id"))
         return AuctionRecord(
-            id            = str(_get("id") or ""),
+            id            = str(_walk(item, get("id")) or ""),
             source        = source,
             lot_id        = str(_lot) if _lot is not None else None,
-            url           = _get("url"),
-            manufacturer  = str(_get("manufacturer") or "").strip().title(),
-            model         = str(_get("model") or "").strip().title(),
-            sold_price    = _to_float(_get("sold_price")),
-            reserve_price = _to_float(_get("reserve_price")),
-            start_price   = _to_float(_get("start_price")),
-            currency      = str(_get("currency") or "GBP").upper(),
-            auction_date  = _to_date(_get("auction_date"), source),
+            url           = _walk(item, get("url")),
+            manufacturer  = _to_title(_walk(item, get("manufacturer"))),
+            model         = _to_title(_walk(item, get("model"))),
+            sold_price    = _to_float(_walk(item, get("sold_price"))),
+            reserve_price = _to_float(_walk(item, get("reserve_price"))),
+            start_price   = _to_float(_walk(item, get("start_price"))),
+            currency      = _to_currency(_walk(item, get("currency"))),
+            auction_date  = _to_date(_walk(item, get("auction_date")), source),
             raw           = raw,
         )
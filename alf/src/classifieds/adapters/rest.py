@@ -1,31 +1,47 @@
 import logging
 from typing import Any, Optional
 
-from src.adapters.rest import RestAdapter, _get_field, _to_date, _to_float
+from src.adapters.rest import RestAdapter, _to_currency, _to_date, _to_float, _to_title, _walk
 from src.classifieds.adapters.base import BaseClassifiedAdapter
 from src.classifieds.models import ClassifiedListing
 
 log = logging.getLogger(__name__)
 
+# Odometer unit assumed when a site does not report one
+_DEFAULT_MILEAGE_UNIT = "miles"
+
 
 def _to_int(v: Any) -> Optional[int]:
     if v is None:
         return None
+    if type(v) is int:
+        return v
     try:
         return int(float(v))
     except (TypeError, ValueError):
         return None
 
 
-class ClassifiedRestAdapter(BaseClassifiedAdapter, RestAdapter):
+def _to_mileage_unit(v: Any) -> str:
+    if not v:
+        return _DEFAULT_MILEAGE_UNIT
+    return str(v).lower()
+
+
+class ClassifiedRestAdapter(RestAdapter, BaseClassifiedAdapter):
     """
     Generic REST adapter for classified listing sites.
 
     Inherits all HTTP fetch and pagination logic from RestAdapter:
+      - __init__() (compiled field_mapping) and fetch()
       - _fetch_offset() with offset_step and max_pages support
       - _fetch_cursor() with max_pages support
       - _unwrap() with common wrapper key detection
-      - dot-notation field path support via _get_field()
+      - dot-notation field path support via _compile_mapping() / _walk()
+
+    RestAdapter is listed first so its __init__ and fetch() resolve directly
+    through the MRO; BaseClassifiedAdapter is kept as a base so the class
+    still satisfies the classifieds adapter contract.
 
     Overrides parse() and _map_item() to produce ClassifiedListing
     instances with classifieds-specific fields (price, mileage, year,
@@ -33,62 +49,40 @@ class ClassifiedRestAdapter(BaseClassifiedAdapter, RestAdapter):
     """
 
     name = "rest"
-
-    def __init__(self, site_config: dict[str, Any], fetcher: Any) -> None:
-        # Explicitly initialise BaseClassifiedAdapter (sets self.config, self.fetcher)
-        BaseClassifiedAdapter.__init__(self, site_config, fetcher)
-        # Pre-compute once at construction; field_mapping never changes at runtime.
-        self._field_mapping: dict[str, str] = site_config.get("field_mapping", {})
-        self._mapped_top_keys: frozenset[str] = frozenset(
-            v.split(".")[0] for v in self._field_mapping.values() if v
-        )
-
-    def fetch(self) -> list[ClassifiedListing]:
-        """Delegate to RestAdapter.fetch() — all pagination logic is inherited."""
-        return RestAdapter.fetch(self)
+    _record_label = "listing"
 
     def parse(self, raw_response: Any) -> list[ClassifiedListing]:
-        source  = self.config["name"]
-        records = []
-
-        items = self._unwrap(raw_response)
-        for item in items:
-            try:
-                records.append(self._map_item(item, self._field_mapping, source))
-            except Exception as exc:
-                log.warning("[%s] skipping malformed listing: %s — %r", source, exc, item)
-
-        log.debug("[%s] parsed %d listings", source, len(records))
-        return records
+        source   = self.config["name"]
+        listings = self._map_items(self._unwrap(raw_response), source)
+        log.debug("[%s] parsed %d listings", source, len(listings))
+        return listings
 
     def _map_item(
         self,
         item: dict[str, Any],
-        mapping: dict[str, str],
+        paths: dict[str, tuple[str, ...]],
         source: str,
     ) -> ClassifiedListing:
         """Map a single API response dict to a ClassifiedListing."""
-        def _get(canonical: str) -> Any:
-            return _get_field(item, mapping, canonical)
-
+        get = paths.get
         raw = {k: v for k, v in item.items() if k not in self._mapped_top_keys}
 
         return ClassifiedListing(
-            id           = str(_get("id") or ""),
+            id           = str(_walk(item, get("id")) or ""),
             source       = source,
-            manufacturer = str(_get("manufacturer") or "").strip().title(),
-            model        = str(_get("model") or "").strip().title(),
-            year         = _to_int(_get("year")),
-            price        = _to_float(_get("price")),
-            currency     = str(_get("currency") or "GBP").upper(),
-            mileage      = _to_int(_get("mileage")),
-            mileage_unit = str(_get("mileage_unit") or "miles").lower(),
-            condition    = _get("condition"),
-            fuel_type    = _get("fuel_type"),
-            transmission = _get("transmission"),
-            colour       = _get("colour"),
-            location     = _get("location"),
-            url          = _get("url"),
-            listed_date  = _to_date(_get("listed_date"), source),
+            manufacturer = _to_title(_walk(item, get("manufacturer"))),
+            model        = _to_title(_walk(item, get("model"))),
+            year         = _to_int(_walk(item, get("year"))),
+            price        = _to_float(_walk(item, get("price"))),
+            currency     = _to_currency(_walk(item, get("currency"))),
+            mileage      = _to_int(_walk(item, get("mileage"))),
+            mileage_unit = _to_mileage_unit(_walk(item, get("mileage_unit"))),
+            condition    = _walk(item, get("condition")),
+            fuel_type    = _walk(item, get("fuel_type")),
+            transmission = _walk(item, get("transmission")),
+            colour       = _walk(item, get("colour")),
+            location     = _walk(item, get("location")),
+            url          = _walk(item, get("url")),
+            listed_date  = _to_date(_walk(item, get("listed_date")), source),
             raw          = raw,
         )
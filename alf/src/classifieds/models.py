@@ -2,8 +2,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from src.models import _slug
 
-@dataclass
+
+@dataclass(slots=True)
 class ClassifiedListing:
     # Identity
     id: str                          # Site-native listing/ad ID
@@ -70,7 +72,7 @@ class ClassifiedListing:
     @property
     def storage_path_parts(self) -> tuple[str, str, str]:
         """Returns (manufacturer_slug, model_slug, date_str) for path construction."""
-        mfr  = self.manufacturer.lower().replace(" ", "_") or "unknown"
-        mdl  = self.model.lower().replace(" ", "_") or "unknown"
+        mfr  = _slug(self.manufacturer)
+        mdl  = _slug(self.model)
         date = self.listed_date or self.harvested_at[:10]
         return mfr, mdl, date
@@ -1,14 +1,18 @@
-import json
 import logging
 from pathlib import Path
 
 import filelock
 
 from src.classifieds.models import ClassifiedListing
+from src.storage import (
+    _append_index, _append_to_array, _load_array, _read_index, _rebuild_index, _write_array,
+    _write_groups,
+)
 
 log = logging.getLogger(__name__)
 
 _LOCK_TIMEOUT = 10
+_LOCK_POLL_INTERVAL = 0.002
 
 
 class ClassifiedStorage:
@@ -19,42 +23,49 @@ class ClassifiedStorage:
         {data_dir}/classifieds/{manufacturer}/{model}/{YYYY-MM-DD}/listings.json
 
     Each listings.json is a JSON array. New records are appended without
-    duplicating by `id`. Uses per-file filelock for thread safety.
+    duplicating by `id`, in place when the sidecar listings.ids index is
+    current. Uses per-file filelock for thread safety.
     """
 
     def __init__(self, data_dir: str) -> None:
         self._data_dir = Path(data_dir)
+        # Partition directories already created by this instance
+        self._ensured_dirs: set[Path] = set()
 
     def save(self, listings: list[ClassifiedListing]) -> int:
         """
         Persist a list of listings to disk.
 
-        Groups by storage path, writes each group under a single lock.
-        Returns total number of new listings written (existing IDs skipped).
+        Groups by storage path, writes each group under a single lock,
+        several paths at a time. Returns total number of new listings written (existing IDs skipped).
         """
         if not listings:
             return 0
 
-        groups: dict[Path, list[ClassifiedListing]] = {}
+        groups: dict[tuple[str, str, str], list[ClassifiedListing]] = {}
         for listing in listings:
-            path = self._resolve_path(listing)
-            groups.setdefault(path, []).append(listing)
+            groups.setdefault(listing.storage_path_parts, []).append(listing)
 
-        total_written = 0
-        for path, group in groups.items():
-            total_written += self._write_group(path, group)
+        return _write_groups(
+            self._write_group,
+            {self._resolve_path(*parts): group for parts, group in groups.items()},
+        )
 
-        return total_written
-
-    def _resolve_path(self, listing: ClassifiedListing) -> Path:
-        mfr, mdl, date = listing.storage_path_parts
-        return self._data_dir / "classifieds" / mfr / mdl / date / "listings.json"
+    def _resolve_path(self, mfr: str, mdl: str, date: str) -> Path:
+        return self._data_dir.joinpath("classifieds", mfr, mdl, date, "listings.json")
 
     def _write_group(self, path: Path, listings: list[ClassifiedListing]) -> int:
         lock_path = path.with_suffix(".lock")
         try:
-            with filelock.FileLock(str(lock_path), timeout=_LOCK_TIMEOUT):
-                return self._merge_and_write(path, listings)
+            lock = filelock.FileLock(str(lock_path), timeout=_LOCK_TIMEOUT)
+            with lock.acquire(poll_interval=_LOCK_POLL_INTERVAL):
+                try:
+                    return self._merge_and_write(path, listings)
+                except FileNotFoundError:
+                    # Partition directory removed since it was cached (cleanup,
+                    # rotation): forget it so the retry recreates it
+                    self._ensured_dirs.discard(path.parent)
+                    return self._merge_and_write(path, listings)
         except filelock.Timeout:
             log.error("Lock timeout for %s — skipping %d listings", path, len(listings))
             return 0
@@ -63,27 +74,37 @@ class ClassifiedStorage:
             return 0
 
     def _merge_and_write(self, path: Path, listings: list[ClassifiedListing]) -> int:
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        existing: list[dict] = []
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, OSError) as exc:
-                log.warning("Could not read %s: %s — overwriting", path, exc)
-                existing = []
-
-        existing_ids = {r.get("id") for r in existing}
-        new_dicts    = [l.to_dict() for l in listings if l.id not in existing_ids]
+        if path.parent not in self._ensured_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path.parent)
+        index_path = path.with_suffix(".ids")
+
+        existing_ids = _read_index(index_path, path)
+        if existing_ids is not None:
+            new_dicts = [l.to_dict() for l in listings if l.id not in existing_ids]
+            if not new_dicts:
+                log.debug("All %d listings already stored at %s", len(listings), path)
+                return 0
+            size = _append_to_array(path, new_dicts)
+            if size is not None:
+                _append_index(index_path, (d["id"] for d in new_dicts), size)
+                log.debug("Appended %d new listings to %s", len(new_dicts), path)
+                return len(new_dicts)
+
+        existing, size = _load_array(path, index_path)
+        existing_ids   = {r.get("id") for r in existing}
+        new_dicts      = [l.to_dict() for l in listings if l.id not in existing_ids]
 
         if not new_dicts:
+            if size is not None:
+                _rebuild_index(index_path, existing_ids, size)
+            elif existing:
+                _write_array(path, index_path, existing)
             log.debug("All %d listings already stored at %s", len(listings), path)
             return 0
 
         merged = existing + new_dicts
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged, f, indent=2, ensure_ascii=False)
+        _write_array(path, index_path, merged)
 
         log.debug("Wrote %d new listings to %s (total %d)", len(new_dicts), path, len(merged))
         return len(new_dicts)
@@ -1,17 +1,21 @@
-import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 from src.adapters import ADAPTER_REGISTRY
-from src.fetcher import Fetcher
-from src.fx import FXProvider
+from src.fetcher import Fetcher, SessionPool
+from src.fx import FXProvider, apply_rate, get_fx_provider
 from src.models import AuctionRecord
 from src.storage import AuctionStorage
 
 log = logging.getLogger(__name__)
 
+# Sentinel for per-batch rate lookups (a cached rate may legitimately be None)
+_MISSING = object()
+
 
 class HarvestClient:
     """
@@ -20,20 +24,25 @@ class HarvestClient:
     Adapters and their underlying Fetchers (HTTP sessions) are constructed
     once at startup and reused across every call to run(), so TCP connections
     and OAuth2 tokens survive between batches. FXProvider is similarly
-    long-lived and refreshes exchange rates only when its TTL expires.
+    long-lived (shared process-wide via get_fx_provider) and refreshes exchange
+    rates only when its TTL expires.
     """
 
     def __init__(self, config_dir: str, data_dir: Optional[str] = None) -> None:
         self._settings    = self._load_json(Path(config_dir) / "settings.json")
         self._data_dir    = data_dir or self._settings.get("data_dir", "data")
-        self._max_workers = self._settings.get("max_workers", 4)
+        # Unset means one thread per enabled site: fetches are IO-bound and
+        # ThreadPoolExecutor only starts a thread when work is waiting for one.
+        self._max_workers: Optional[int] = self._settings.get("max_workers")
         self._storage     = AuctionStorage(self._data_dir)
         # Build once; reuse sessions and auth tokens across all batch runs.
         self._adapters = self._build_adapters(
             self._load_json(Path(config_dir) / "sites.json").get("sites", [])
         )
         fx_cfg = self._settings.get("fx", {})
-        self._fx: Optional[FXProvider] = FXProvider(fx_cfg) if fx_cfg.get("enabled") else None
+        self._fx: Optional[FXProvider] = (
+            get_fx_provider(fx_cfg, data_dir=self._data_dir) if fx_cfg.get("enabled") else None
+        )
 
     @property
     def batch_interval_seconds(self) -> int:
@@ -58,45 +67,46 @@ class HarvestClient:
             return _empty_stats()
 
         log.info("Starting batch: %d site(s)", len(self._adapters))
-        results:  dict[str, list[AuctionRecord]] = {}
-        failures: dict[str, str]                 = {}
-
-        with ThreadPoolExecutor(
-            max_workers=min(self._max_workers, len(self._adapters)),
-            thread_name_prefix="alf-site",
-        ) as executor:
-            future_to_name = {
-                executor.submit(adapter.fetch): name
-                for name, adapter in self._adapters.items()
-            }
-            for future in as_completed(future_to_name):
-                name = future_to_name[future]
-                try:
-                    records = future.result()
-                    results[name] = records
-                    log.info("[%s] fetched %d records", name, len(records))
-                except Exception as exc:
-                    failures[name] = str(exc)
-                    log.error("[%s] site fetch failed: %s", name, exc)
-                    results[name] = []
-
-        # Apply FX in the main thread; the long-lived FXProvider refreshes
-        # its rate table automatically when the TTL expires.
-        if self._fx:
-            for name in results:
-                for record in results[name]:
-                    _apply_fx(record, self._fx)
-
-        site_stats: dict[str, dict[str, int]] = {}
-        total_fetched = 0
-        total_written = 0
-
-        for name, records in results.items():
-            fetched = len(records)
-            written = self._storage.save(records)
-            total_fetched += fetched
-            total_written += written
-            site_stats[name] = {"fetched": fetched, "written": written}
+        fetched:  dict[str, int]         = {}
+        pending:  dict[str, Future[int]] = {}
+        failures: dict[str, str]         = {}
+
+        # Each site is FX-converted and handed to a single writer thread as
+        # soon as its fetch completes, so JSON serialisation and disk IO
+        # overlap the remaining fetches instead of waiting for all of them.
+        # One writer keeps saves ordered and off the fetch workers.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="alf-site-writer") as writer:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers or len(self._adapters), len(self._adapters)),
+                thread_name_prefix="alf-site",
+            ) as executor:
+                future_to_name = {
+                    executor.submit(adapter.fetch): name
+                    for name, adapter in self._adapters.items()
+                }
+                for future in as_completed(future_to_name):
+                    name = future_to_name[future]
+                    try:
+                        records = future.result()
+                        log.info("[%s] fetched %d records", name, len(records))
+                    except Exception as exc:
+                        failures[name] = str(exc)
+                        log.error("[%s] site fetch failed: %s", name, exc)
+                        records = []
+                    # FX stays on this thread; the long-lived FXProvider
+                    # refreshes its rate table when the TTL expires.
+                    if self._fx:
+                        _apply_fx(records, self._fx)
+                    fetched[name] = len(records)
+                    pending[name] = writer.submit(self._storage.save, records)
+
+        written = {name: write.result() for name, write in pending.items()}
+        site_stats = {
+            name: {"fetched": fetched[name], "written": written[name]}
+            for name in pending
+        }
+        total_fetched = sum(fetched.values())
+        total_written = sum(written.values())
 
         log.info(
             "Batch complete: %d fetched, %d written, %d site(s) failed",
@@ -120,11 +130,13 @@ class HarvestClient:
         """
         Construct one Fetcher + Adapter per enabled site.
 
-        Both objects are long-lived: the Fetcher wraps a requests.Session
-        that maintains a connection pool, and the Adapter caches its
-        field_mapping at construction time.
+        Both objects are long-lived: the Fetchers draw on one SessionPool
+        whose requests.Session maintains keep-alive connection pools, and
+        the Adapter caches its field_mapping at construction time.
         """
         global_retry = self._settings.get("retry", {})
+        # One keep-alive pool for all sites, so sites on a shared host reuse connections
+        sessions = SessionPool()
         adapters: dict[str, Any] = {}
         for site in sites:
             if not site.get("enabled", False):
@@ -136,20 +148,31 @@ class HarvestClient:
                     f"Unknown adapter {adapter_name!r} for site {site['name']!r}. "
                     f"Available: {list(ADAPTER_REGISTRY)}"
                 )
-            adapters[site["name"]] = adapter_cls(site, Fetcher(site, global_retry))
+            adapters[site["name"]] = adapter_cls(site, Fetcher(site, global_retry, sessions))
         return adapters
 
     @staticmethod
     def _load_json(path: Path) -> dict[str, Any]:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-
-
-def _apply_fx(record: AuctionRecord, fx: FXProvider) -> None:
-    record.base_currency      = fx.base_currency
-    record.sold_price_base    = fx.convert(record.sold_price,    record.currency)
-    record.reserve_price_base = fx.convert(record.reserve_price, record.currency)
-    record.start_price_base   = fx.convert(record.start_price,   record.currency)
+        return orjson.loads(path.read_bytes())
+
+
+def _apply_fx(records: list[AuctionRecord], fx: FXProvider) -> None:
+    """Convert a site's prices to the base currency, resolving each currency's rate once."""
+    rates: dict[str, Optional[float]] = {}
+    base = fx.base_currency
+    for record in records:
+        if record.sold_price is None and record.reserve_price is None and record.start_price is None:
+            # Nothing to convert: don't let it trigger a refetch or rate warning
+            rate = None
+        else:
+            currency = record.currency
+            rate = rates.get(currency, _MISSING)
+            if rate is _MISSING:
+                rate = rates[currency] = fx.rate(currency)
+        record.base_currency      = base
+        record.sold_price_base    = apply_rate(record.sold_price,    rate)
+        record.reserve_price_base = apply_rate(record.reserve_price, rate)
+        record.start_price_base   = apply_rate(record.start_price,   rate)
 
 
 def _empty_stats() -> dict[str, Any]:
@@ -1,22 +1,41 @@
+import http.cookiejar
 import logging
 import os
+import random
 import time
 from threading import Lock
 from typing import Any, Optional
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from requests.cookies import RequestsCookieJar, merge_cookies
 
 log = logging.getLogger(__name__)
 
+# urllib3's default pool size; raised when a site prefetches more pages in parallel
+_DEFAULT_POOL_SIZE = 10
+# Connections kept per host by a SessionPool shared across every site in a client
+_SHARED_POOL_SIZE = 64
+# Distinct hosts a shared session keeps pools for
+_SHARED_POOL_HOSTS = 32
+
+# X-RateLimit-Reset values above this are epoch timestamps rather than a
+# seconds-until-reset delta (both conventions are common).
+_EPOCH_THRESHOLD = 1_000_000_000
+# Never let a misreported reset header stall a site for longer than this
+_MAX_RATE_LIMIT_WAIT = 300.0
+# Upper bound on a single retry back-off (urllib3's Retry.DEFAULT_BACKOFF_MAX)
+_MAX_BACKOFF = 120.0
+
 
 class TokenBucket:
     """
     Thread-safe token bucket for rate limiting.
 
     Allows up to `burst` tokens initially; refills at `rate` tokens/second.
-    Calling consume() blocks until a token is available.
+    Calling consume() blocks until a token is available. defer() empties the
+    bucket when the server reports its quota is exhausted.
     """
 
     def __init__(self, rate: float, burst: int = 1) -> None:
@@ -37,50 +56,143 @@ class TokenBucket:
                 self._tokens -= 1.0
                 return
             wait = (1.0 - self._tokens) / self._rate
+            # Claim the token now: the bucket is empty as of the moment this
+            # caller wakes. Later callers see _last in the future (a negative
+            # elapsed) and queue up behind it without re-locking after sleep.
+            self._tokens = 0.0
+            self._last   = now + wait
 
         # Sleep outside the lock so other threads can manage their own buckets
         time.sleep(wait)
+
+    def defer(self, seconds: float) -> None:
+        """Ensure the next token is not available for at least `seconds`."""
         with self._lock:
-            now = time.monotonic()
+            now     = time.monotonic()
             elapsed = now - self._last
-            self._last = now
-            self._tokens = min(self._burst, self._tokens + elapsed * self._rate) - 1.0
+            self._last   = now
+            self._tokens = min(
+                self._burst,
+                self._tokens + elapsed * self._rate,
+                1.0 - seconds * self._rate,
+            )
+
+
+class SessionPool:
+    """
+    One keep-alive requests.Session shared by every Fetcher of a client.
+
+    Sites on the same host (e.g. eBay UK and US both on api.ebay.com) reuse
+    each other's pooled TCP+TLS connections. The session carries no retry
+    policy, auth or cookies — Fetcher retries and sends auth and its own
+    cookie jar per request, so sites with different policies and
+    credentials still share it.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = _SHARED_POOL_SIZE,
+        pool_connections: int = _SHARED_POOL_HOSTS,
+    ) -> None:
+        self._pool_maxsize     = pool_maxsize
+        self._pool_connections = pool_connections
+        self._session: Optional[requests.Session] = None
+
+    def get(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            self._session = self._build()
+        return self._session
+
+    def _build(self) -> requests.Session:
+        adapter = HTTPAdapter(
+            max_retries      = 0,
+            pool_connections = self._pool_connections,
+            pool_maxsize     = self._pool_maxsize,
+        )
+        session = requests.Session()
+        # Refuse to store response cookies: they would be sent on every other
+        # site's requests. Each Fetcher keeps its own jar instead.
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
 
 class Fetcher:
     """
     HTTP client for a single auction site.
 
-    Wraps a requests.Session with:
+    Uses a requests.Session from a SessionPool with:
       - Auth injection from site config (api_key / bearer / basic /
-        oauth2_client_credentials / none)
-      - Rate limiting via TokenBucket
-      - Automatic retry with exponential backoff via urllib3 Retry
+        oauth2_client_credentials / none), sent per request so the
+        session itself stays shareable
+      - Rate limiting via TokenBucket, tightened by X-RateLimit-Remaining /
+        X-RateLimit-Reset response headers when the server sends them
+      - Retry with jittered exponential backoff on connection errors and
+        retry_on_status responses, taking a fresh token for every attempt
       - OAuth2 token refresh when tokens are near expiry
+      - Keep-alive connection pooling: every page of a harvest reuses the
+        same pooled connections
 
-    One Fetcher instance is created per enabled site in client.py.
-    Fetcher instances are NOT shared across sites.
+    One Fetcher instance is created per enabled site in client.py. Fetchers
+    are not shared across sites, but the clients pass one SessionPool to all
+    of them so connections are. Without a pool argument the Fetcher gets a
+    private session sized to the site's page concurrency.
     """
 
-    def __init__(self, site_config: dict[str, Any], global_retry: dict[str, Any]) -> None:
-        self._config  = site_config
-        self._session = requests.Session()
+    def __init__(
+        self,
+        site_config: dict[str, Any],
+        global_retry: dict[str, Any],
+        sessions: Optional[SessionPool] = None,
+    ) -> None:
+        self._config = site_config
 
         # Merge retry config: site takes precedence over global defaults
         retry_cfg = {**global_retry, **site_config.get("retry", {})}
-        self._configure_retry(retry_cfg)
+        if sessions is None:
+            # Keep at least one pooled keep-alive connection per prefetch thread
+            # so concurrent pages never fall back to a fresh TCP+TLS handshake.
+            concurrency = int(site_config.get("pagination", {}).get("concurrency", 1))
+            sessions    = SessionPool(pool_maxsize=max(_DEFAULT_POOL_SIZE, concurrency))
+        self._session = sessions.get()
+
+        # max_attempts counts retries after the first try (it was urllib3's
+        # Retry(total=...)), so existing configs keep their attempt budget.
+        self._max_retries     = int(retry_cfg.get("max_attempts", 3))
+        self._backoff_factor  = float(retry_cfg.get("backoff_factor", 2.0))
+        self._retry_on_status = frozenset(
+            retry_cfg.get("retry_on_status", [429, 500, 502, 503, 504])
+        )
+
+        # Auth and cookie state sent with every request (never stored on the
+        # shared session)
+        self._headers: dict[str, str]           = {}
+        self._auth:    Optional[tuple[str, str]] = None
+        self._cookies = RequestsCookieJar()
+        # Prefetch workers share this Fetcher: requests iterates the jar it is
+        # given, so each send gets a snapshot and responses merge back under
+        # the lock. OAuth2 refresh has its own lock so only one worker refetches.
+        self._cookie_lock = Lock()
+        self._oauth2_lock = Lock()
 
         # OAuth2 state (used only when auth type is oauth2_client_credentials)
         self._oauth2_token:      Optional[str]   = None
         self._oauth2_expires_at: float           = 0.0
 
-        self._inject_auth(site_config.get("auth", {}))
+        auth_config = site_config.get("auth", {})
+        # Resolved once so non-OAuth2 sites skip the expiry check per request
+        self._oauth2 = auth_config.get("type", "none") == "oauth2_client_credentials"
+        self._inject_auth(auth_config)
 
         rl = site_config.get("rate_limit", {})
         self._bucket = TokenBucket(
             rate  = float(rl.get("requests_per_second", 1.0)),
             burst = int(rl.get("burst", 1)),
         )
+        self._remaining_header = rl.get("remaining_header", "X-RateLimit-Remaining")
+        self._reset_header     = rl.get("reset_header", "X-RateLimit-Reset")
 
     # ------------------------------------------------------------------
     # Public HTTP interface
@@ -88,41 +200,97 @@ class Fetcher:
 
     def get(self, url: str, params: Optional[dict] = None, **kwargs: Any) -> Any:
         """Rate-limited, retrying GET. Returns parsed JSON."""
-        self._refresh_oauth2_if_needed()
-        self._bucket.consume()
         log.debug("[%s] GET %s params=%s", self._config["name"], url, params)
-        response = self._session.get(url, params=params, timeout=30, **kwargs)
+        response = self._send(self._session.get, url, params=params, **kwargs)
         response.raise_for_status()
-        return response.json()
+        # orjson decodes the raw bytes directly, skipping the str decode step
+        # that response.json() performs before handing off to stdlib json.
+        return orjson.loads(response.content)
 
     def post(self, url: str, **kwargs: Any) -> Any:
         """Rate-limited, retrying POST. Returns parsed JSON."""
-        self._refresh_oauth2_if_needed()
-        self._bucket.consume()
         log.debug("[%s] POST %s", self._config["name"], url)
-        response = self._session.post(url, timeout=30, **kwargs)
+        response = self._send(self._session.post, url, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    def _send(self, send: Any, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Issue a request through `send`, retrying connection errors and
+        retry_on_status responses. The final attempt's response is returned
+        whatever its status, for the caller's raise_for_status().
+        """
+        for attempt in range(self._max_retries):
+            try:
+                response = self._attempt(send, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                delay = self._backoff(attempt)
+                log.warning("[%s] %s — retrying in %.1fs", self._config["name"], exc, delay)
+            else:
+                if response.status_code not in self._retry_on_status:
+                    return response
+                delay = max(self._backoff(attempt), _retry_after(response))
+                log.warning(
+                    "[%s] HTTP %d from %s — retrying in %.1fs",
+                    self._config["name"], response.status_code, url, delay,
+                )
+            time.sleep(delay)
+        return self._attempt(send, url, **kwargs)
+
+    def _attempt(self, send: Any, url: str, **kwargs: Any) -> requests.Response:
+        """One request; every attempt, retries included, consumes its own token."""
+        self._refresh_oauth2_if_needed()
+        self._bucket.consume()
+        headers = self._headers
+        extra_headers = kwargs.pop("headers", None)
+        if extra_headers:
+            # Caller headers layer over (and may override) the auth headers
+            headers = {**headers, **extra_headers}
+        with self._cookie_lock:
+            cookies = self._cookies.copy()
+        extra_cookies = kwargs.pop("cookies", None)
+        if extra_cookies:
+            cookies = merge_cookies(cookies, extra_cookies)
+        kwargs.setdefault("auth", self._auth)
+        kwargs.setdefault("timeout", 30)
+        response = send(url, headers=headers, cookies=cookies, **kwargs)
+        if response.cookies:
+            with self._cookie_lock:
+                self._cookies.update(response.cookies)
+        self._observe_rate_limit(response)
+        return response
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff for the given retry, jittered to 0.5–1.5x."""
+        # Jitter keeps sites on a shared provider from retrying in lockstep
+        delay = self._backoff_factor * (2 ** attempt) * (0.5 + random.random())
+        return min(delay, _MAX_BACKOFF)
+
+    def _observe_rate_limit(self, response: requests.Response) -> None:
+        """
+        Hold the TokenBucket until the server's quota window resets once the
+        response reports no remaining requests. 429/503 back-off itself is
+        handled by _send (which honours Retry-After).
+        """
+        try:
+            remaining = float(response.headers[self._remaining_header])
+            reset     = float(response.headers[self._reset_header])
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining > 0:
+            return
+        wait = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+        wait = min(max(wait, 0.0), _MAX_RATE_LIMIT_WAIT)
+        log.info("[%s] rate limit exhausted — pausing %.1fs", self._config["name"], wait)
+        self._bucket.defer(wait)
 
     # ------------------------------------------------------------------
     # Setup helpers
     # ------------------------------------------------------------------
 
-    def _configure_retry(self, retry_cfg: dict[str, Any]) -> None:
-        retry = Retry(
-            total            = retry_cfg.get("max_attempts", 3),
-            backoff_factor   = retry_cfg.get("backoff_factor", 2.0),
-            status_forcelist = retry_cfg.get("retry_on_status", [429, 500, 502, 503, 504]),
-            allowed_methods  = ["GET", "POST"],
-            raise_on_status  = False,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
-
     def _inject_auth(self, auth_config: dict[str, Any]) -> None:
         """
-        Inject authentication into the session.
+        Resolve authentication into the per-request headers / auth tuple.
 
         Credentials are read from environment variables at Fetcher
         construction time so that missing env vars surface early as
@@ -133,16 +301,16 @@ class Fetcher:
         if auth_type == "api_key":
             header  = auth_config["header"]
             env_var = auth_config["env_var"]
-            self._session.headers[header] = os.environ[env_var]
+            self._headers[header] = os.environ[env_var]
 
         elif auth_type == "bearer":
             token = os.environ[auth_config["env_var"]]
-            self._session.headers["Authorization"] = f"Bearer {token}"
+            self._headers["Authorization"] = f"Bearer {token}"
 
         elif auth_type == "basic":
             username = os.environ[auth_config["username_env_var"]]
             password = os.environ[auth_config["password_env_var"]]
-            self._session.auth = (username, password)
+            self._auth = (username, password)
 
         elif auth_type == "oauth2_client_credentials":
             self._fetch_oauth2_token(auth_config)
@@ -159,7 +327,7 @@ class Fetcher:
 
     def _fetch_oauth2_token(self, auth_config: Optional[dict[str, Any]] = None) -> None:
         """
-        Obtain an OAuth2 client credentials token and set it on the session.
+        Obtain an OAuth2 client credentials token and set it as the bearer header.
         Stores expiry time so _refresh_oauth2_if_needed() can check it.
         """
         if auth_config is None:
@@ -190,14 +358,23 @@ class Fetcher:
         # Refresh 60 seconds before actual expiry to avoid using an expired token
         self._oauth2_expires_at = time.monotonic() + expires_in - 60
 
-        self._session.headers["Authorization"] = f"Bearer {self._oauth2_token}"
+        self._headers["Authorization"] = f"Bearer {self._oauth2_token}"
         log.debug("[%s] OAuth2 token obtained, expires in %ds", self._config["name"], expires_in)
 
     def _refresh_oauth2_if_needed(self) -> None:
         """Re-fetch the OAuth2 token if it is expired or near expiry."""
-        auth_type = self._config.get("auth", {}).get("type", "none")
-        if auth_type != "oauth2_client_credentials":
+        if not self._oauth2 or time.monotonic() < self._oauth2_expires_at:
             return
-        if time.monotonic() >= self._oauth2_expires_at:
-            log.info("[%s] OAuth2 token expired — refreshing", self._config["name"])
-            self._fetch_oauth2_token()
+        with self._oauth2_lock:
+            # Re-check: another worker may have refreshed while this one waited
+            if time.monotonic() >= self._oauth2_expires_at:
+                log.info("[%s] OAuth2 token expired — refreshing", self._config["name"])
+                self._fetch_oauth2_token()
+
+
+def _retry_after(response: requests.Response) -> float:
+    """Seconds requested by a Retry-After header (delta form only), else 0."""
+    try:
+        return min(max(float(response.headers["Retry-After"]), 0.0), _MAX_RATE_LIMIT_WAIT)
+    except (KeyError, TypeError, ValueError):
+        return 0.0
@@ -1,8 +1,12 @@
 import logging
 import os
+import tempfile
 import time
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
+import orjson
 import requests
 
 log = logging.getLogger(__name__)
@@ -10,6 +14,29 @@ log = logging.getLogger(__name__)
 _TIMEOUT = 10  # seconds per HTTP request
 
 
+def get_fx_provider(config: dict, data_dir: Optional[str] = None) -> "FXProvider":
+    """
+    Return the process-wide FXProvider for this fx config and data_dir.
+
+    Clients with identical fx settings (e.g. auctions and classifieds run in
+    one process) share a single rate table and TTL instead of each fetching
+    and caching their own.
+    """
+    return _shared_provider(orjson.dumps(config, option=orjson.OPT_SORT_KEYS), data_dir)
+
+
+def apply_rate(amount: Optional[float], rate: Optional[float]) -> Optional[float]:
+    """Scale amount by a rate from FXProvider.rate(); None if either is missing."""
+    if amount is None or rate is None:
+        return None
+    return round(amount * rate, 2)
+
+
+@lru_cache(maxsize=4)
+def _shared_provider(config_json: bytes, data_dir: Optional[str]) -> "FXProvider":
+    return FXProvider(orjson.loads(config_json), data_dir=data_dir)
+
+
 class FXProvider:
     """
     Fetches live exchange rates and converts prices to a common base currency.
@@ -19,6 +46,12 @@ class FXProvider:
     FXProvider instance therefore shares its rate table across multiple
     batch runs without re-hitting the network unless the TTL has elapsed.
 
+    When constructed with a data_dir, successfully fetched rates are also
+    written to {data_dir}/.fx_cache/{provider}_{base}.json and reused by any
+    FXProvider (including in later processes) until cache_ttl_seconds
+    (default 21600) has elapsed, so provider APIs that only publish daily
+    rates are not re-queried on every in-memory TTL expiry or restart.
+
     Internally stores rates as "units of base currency per 1 source currency"
     so conversion is always: base_amount = source_amount * rate.
 
@@ -48,12 +81,13 @@ class FXProvider:
         "base_currency": "GBP",
         "provider": "frankfurter",
         "api_key_env_var": null,
-        "rates_ttl_seconds": 3600
+        "rates_ttl_seconds": 3600,
+        "cache_ttl_seconds": 21600
       }
     }
     """
 
-    def __init__(self, config: dict) -> None:
+    def __init__(self, config: dict, data_dir: Optional[str] = None) -> None:
         self.base_currency: str      = config.get("base_currency", "GBP").upper()
         self._provider: str          = config.get("provider", "frankfurter").lower()
         key_env: Optional[str]       = config.get("api_key_env_var") or None
@@ -64,6 +98,12 @@ class FXProvider:
         # float("-inf") ensures the first convert() call always triggers a fetch.
         self._rates_ttl: float  = float(config.get("rates_ttl_seconds", 3600))
         self._fetched_at: float = float("-inf")
+        # On-disk cache shared across instances and processes (disabled without data_dir)
+        self._cache_ttl: float = float(config.get("cache_ttl_seconds", 21600))
+        self._cache_path: Optional[Path] = (
+            Path(data_dir) / ".fx_cache" / f"{self._provider}_{self.base_currency}.json"
+            if data_dir else None
+        )
 
     def convert(self, amount: Optional[float], from_currency: str) -> Optional[float]:
         """
@@ -74,9 +114,20 @@ class FXProvider:
         """
         if amount is None:
             return None
+        return apply_rate(amount, self.rate(from_currency))
+
+    def rate(self, from_currency: str) -> Optional[float]:
+        """
+        Units of base_currency per 1 unit of from_currency, refreshing the
+        rate table first if its TTL has expired.
+
+        Callers converting many amounts look the rate up once per currency
+        and scale with apply_rate(). Returns None (with a warning) for
+        unknown currencies.
+        """
         from_currency = from_currency.upper()
         if from_currency == self.base_currency:
-            return round(amount, 2)
+            return 1.0
 
         if time.monotonic() - self._fetched_at >= self._rates_ttl:
             self._fetch()
@@ -84,9 +135,7 @@ class FXProvider:
         rate = self._rates.get(from_currency)
         if rate is None:
             log.warning("No FX rate available for %s → %s", from_currency, self.base_currency)
-            return None
-
-        return round(amount * rate, 2)
+        return rate
 
     # ------------------------------------------------------------------
     # Fetch dispatch
@@ -94,6 +143,8 @@ class FXProvider:
 
     def _fetch(self) -> None:
         try:
+            if self._load_cache():
+                return
             if self._provider == "frankfurter":
                 self._fetch_frankfurter()
             elif self._provider == "openexchangerates":
@@ -108,6 +159,7 @@ class FXProvider:
                 "FX rates loaded from %s (base=%s, %d currencies)",
                 self._provider, self.base_currency, len(self._rates),
             )
+            self._save_cache()
         except Exception as exc:
             log.error("Failed to fetch FX rates from %s: %s", self._provider, exc)
             # _rates may be empty; convert() will return None for all non-base currencies.
@@ -116,6 +168,51 @@ class FXProvider:
             # window don't re-trigger _fetch(), even on failure.
             self._fetched_at = time.monotonic()
 
+    # ------------------------------------------------------------------
+    # On-disk cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> bool:
+        """Load rates from the disk cache if it exists and is within cache_ttl_seconds."""
+        if self._cache_path is None:
+            return False
+        try:
+            data  = orjson.loads(self._cache_path.read_bytes())
+            age   = time.time() - float(data["fetched_at"])
+            rates = {k: float(v) for k, v in data["rates"].items()}
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            log.warning("Ignoring unreadable FX cache %s: %s", self._cache_path, exc)
+            return False
+        if age >= self._cache_ttl:
+            return False
+        self._rates = rates
+        log.info(
+            "FX rates loaded from cache %s (base=%s, %d currencies, age %.0fs)",
+            self._cache_path, self.base_currency, len(rates), age,
+        )
+        return True
+
+    def _save_cache(self) -> None:
+        """Atomically write the current rate table to the disk cache."""
+        if self._cache_path is None:
+            return
+        payload = orjson.dumps({"fetched_at": time.time(), "rates": self._rates})
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp, self._cache_path)
+            except BaseException:
+                # Don't leave the half-written temp file behind in the cache dir
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            log.warning("Could not write FX cache %s: %s", self._cache_path, exc)
+
     # ------------------------------------------------------------------
     # Provider implementations
     # ------------------------------------------------------------------
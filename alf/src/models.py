@@ -1,9 +1,18 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
 
-@dataclass
+# A batch repeats a few dozen names, so cached slugs come back as the same
+# str objects with their hashes already computed for storage's grouping.
+@lru_cache(maxsize=1024)
+def _slug(name: str) -> str:
+    """Path-safe slug for a manufacturer/model name ("Land Rover" -> "land_rover")."""
+    return name.lower().replace(" ", "_") or "unknown"
+
+
+@dataclass(slots=True)
 class AuctionRecord:
     # Identity
     id: str                          # Site-native auction/lot ID
@@ -60,7 +69,7 @@ class AuctionRecord:
     @property
     def storage_path_parts(self) -> tuple[str, str, str]:
         """Returns (manufacturer_slug, model_slug, date_str) for path construction."""
-        mfr  = self.manufacturer.lower().replace(" ", "_") or "unknown"
-        mdl  = self.model.lower().replace(" ", "_") or "unknown"
+        mfr  = _slug(self.manufacturer)
+        mdl  = _slug(self.model)
         date = self.auction_date or self.harvested_at[:10]
         return mfr, mdl, date
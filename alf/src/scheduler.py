@@ -5,6 +5,9 @@ from typing import Any, Optional, Type
 
 log = logging.getLogger(__name__)
 
+# How often the inter-batch wait checks for a stop request
+_STOP_POLL_SECS = 0.2
+
 
 class Scheduler:
     """
@@ -54,9 +57,11 @@ class Scheduler:
         """
         Run batches on the configured interval until SIGINT or SIGTERM.
 
-        The signal handler sets self._stop = True. The scheduler checks
-        this flag once per second during the inter-batch sleep so that
-        shutdown happens within ~1 second of receiving the signal.
+        The signal handler only sets the self._stop flag: taking a lock (as
+        threading.Event.set() does) inside a handler can deadlock against
+        the main thread holding the same lock. The inter-batch wait checks
+        the flag every _STOP_POLL_SECS, so shutdown starts within that
+        long of the signal (or, mid-batch, once the current batch finishes).
         """
         self._register_signals()
         log.info(
@@ -71,13 +76,19 @@ class Scheduler:
                 break
 
             log.info("Sleeping %ds until next batch...", self._interval)
-            for _ in range(self._interval):
-                if self._stop:
-                    break
-                time.sleep(1)
+            self._wait(self._interval)
 
         log.info("Scheduler stopped after %d batch(es).", self._batch_count)
 
+    def _wait(self, seconds: float) -> None:
+        """Sleep up to `seconds`, returning early once a stop is requested."""
+        deadline = time.monotonic() + seconds
+        while not self._stop:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, _STOP_POLL_SECS))
+
     # ------------------------------------------------------------------
     # Signal handling
     # ------------------------------------------------------------------
@@ -1,8 +1,11 @@
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Iterable, Optional
 
 import filelock
+import orjson
 
 from src.models import AuctionRecord
 
@@ -10,6 +13,13 @@ log = logging.getLogger(__name__)
 
 # How long to wait for a file lock before giving up (seconds)
 _LOCK_TIMEOUT = 10
+# How often a contended lock is retried; an indexed append holds it for ~1ms,
+# so filelock's 50ms default would mostly be spent sleeping
+_LOCK_POLL_INTERVAL = 0.002
+# Partition files written concurrently by one save()
+_MAX_WRITE_WORKERS = 8
+# Every non-empty array written by orjson's OPT_INDENT_2 ends with this
+_ARRAY_TAIL = b"\n]"
 
 
 class AuctionStorage:
@@ -20,7 +30,9 @@ class AuctionStorage:
         {data_dir}/{manufacturer}/{model}/{YYYY-MM-DD}/auctions.json
 
     Each auctions.json is a JSON array. New records are appended to the
-    existing array without duplicating by `id`.
+    existing array without duplicating by `id`. A sidecar auctions.ids
+    lists the stored ids so a save can dedup and append in place without
+    re-parsing and rewriting the whole array.
 
     Thread safety is provided by filelock — one .lock file per auctions.json.
     Multiple threads writing to different manufacturer/model/date paths
@@ -29,42 +41,49 @@ class AuctionStorage:
 
     def __init__(self, data_dir: str) -> None:
         self._data_dir = Path(data_dir)
+        # Partition directories already created by this instance
+        self._ensured_dirs: set[Path] = set()
 
     def save(self, records: list[AuctionRecord]) -> int:
         """
         Persist a list of records to disk.
 
         Groups records by their storage path, then writes each group
-        under a single lock acquisition. Returns the total number of
-        new records written (existing IDs are skipped).
+        under a single lock acquisition, several paths at a time. Returns
+        the total number of new records written (existing IDs are skipped).
         """
         if not records:
             return 0
 
-        groups: dict[Path, list[AuctionRecord]] = {}
+        # Group on the slug tuple and build each partition's Path once
+        groups: dict[tuple[str, str, str], list[AuctionRecord]] = {}
         for record in records:
-            path = self._resolve_path(record)
-            groups.setdefault(path, []).append(record)
+            groups.setdefault(record.storage_path_parts, []).append(record)
 
-        total_written = 0
-        for path, group_records in groups.items():
-            total_written += self._write_group(path, group_records)
-
-        return total_written
+        return _write_groups(
+            self._write_group,
+            {self._resolve_path(*parts): group for parts, group in groups.items()},
+        )
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
-    def _resolve_path(self, record: AuctionRecord) -> Path:
-        mfr, mdl, date = record.storage_path_parts
-        return self._data_dir / mfr / mdl / date / "auctions.json"
+    def _resolve_path(self, mfr: str, mdl: str, date: str) -> Path:
+        return self._data_dir.joinpath(mfr, mdl, date, "auctions.json")
 
     def _write_group(self, path: Path, records: list[AuctionRecord]) -> int:
         lock_path = path.with_suffix(".lock")
         try:
-            with filelock.FileLock(str(lock_path), timeout=_LOCK_TIMEOUT):
-                return self._merge_and_write(path, records)
+            lock = filelock.FileLock(str(lock_path), timeout=_LOCK_TIMEOUT)
+            with lock.acquire(poll_interval=_LOCK_POLL_INTERVAL):
+                try:
+                    return self._merge_and_write(path, records)
+                except FileNotFoundError:
+                    # Partition directory removed since it was cached (cleanup,
+                    # rotation): forget it so the retry recreates it
+                    self._ensured_dirs.discard(path.parent)
+                    return self._merge_and_write(path, records)
         except filelock.Timeout:
             log.error("Lock timeout for %s — skipping %d records", path, len(records))
             return 0
@@ -73,27 +92,171 @@ class AuctionStorage:
             return 0
 
     def _merge_and_write(self, path: Path, records: list[AuctionRecord]) -> int:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent not in self._ensured_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path.parent)
+        index_path = path.with_suffix(".ids")
 
-        existing: list[dict] = []
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, OSError) as exc:
-                log.warning("Could not read %s: %s — overwriting", path, exc)
-                existing = []
+        existing_ids = _read_index(index_path, path)
+        if existing_ids is not None:
+            new_dicts = [r.to_dict() for r in records if r.id not in existing_ids]
+            if not new_dicts:
+                log.debug("All %d records already stored at %s", len(records), path)
+                return 0
+            size = _append_to_array(path, new_dicts)
+            if size is not None:
+                _append_index(index_path, (d["id"] for d in new_dicts), size)
+                log.debug("Appended %d new records to %s", len(new_dicts), path)
+                return len(new_dicts)
 
-        existing_ids = {r.get("id") for r in existing}
-        new_dicts    = [r.to_dict() for r in records if r.id not in existing_ids]
+        existing, size = _load_array(path, index_path)
+        existing_ids   = {r.get("id") for r in existing}
+        new_dicts      = [r.to_dict() for r in records if r.id not in existing_ids]
 
         if not new_dicts:
+            # Nothing new, but index the file (or persist a recovered array)
+            # so the next save can append
+            if size is not None:
+                _rebuild_index(index_path, existing_ids, size)
+            elif existing:
+                _write_array(path, index_path, existing)
             log.debug("All %d records already stored at %s", len(records), path)
             return 0
 
         merged = existing + new_dicts
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged, f, indent=2, ensure_ascii=False)
+        _write_array(path, index_path, merged)
 
         log.debug("Wrote %d new records to %s (total %d)", len(new_dicts), path, len(merged))
         return len(new_dicts)
+
+
+# ----------------------------------------------------------------------
+# Write helpers (shared with ClassifiedStorage)
+#
+# The index holds one JSON-encoded id per line. Each append ends with an
+# "@<bytes>" line recording the data file's size, so an index left behind
+# by a crash or an external rewrite of the array is detected and rebuilt.
+# ----------------------------------------------------------------------
+
+def _write_groups(write_group: Any, groups: dict[Path, list[Any]]) -> int:
+    """Run write_group over each partition, overlapping their file IO."""
+    if len(groups) == 1:
+        (path, items), = groups.items()
+        return write_group(path, items)
+    # Distinct paths have distinct lock files, so they never contend
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_WRITE_WORKERS, len(groups)),
+        thread_name_prefix="alf-storage",
+    ) as executor:
+        return sum(executor.map(write_group, groups.keys(), groups.values()))
+
+
+def _load_array(path: Path, index_path: Path) -> tuple[list[dict], Optional[int]]:
+    """
+    Existing items at path, and the file size they were parsed from. The
+    size is None when the file is absent, unreadable or was recovered from
+    a torn append, i.e. whenever it must be rewritten before appending.
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return [], None
+    except OSError as exc:
+        log.warning("Could not read %s: %s — overwriting", path, exc)
+        return [], None
+    try:
+        return orjson.loads(raw), len(raw)
+    except orjson.JSONDecodeError as exc:
+        recovered = _recover_torn_append(raw, index_path)
+        if recovered is not None:
+            log.warning(
+                "%s has a torn append (%s) — keeping its %d earlier records",
+                path, exc, len(recovered),
+            )
+            return recovered, None
+        log.warning("Could not read %s: %s — overwriting", path, exc)
+        return [], None
+
+
+def _recover_torn_append(raw: bytes, index_path: Path) -> Optional[list[dict]]:
+    """
+    The array as it was before an append that did not finish. The index is
+    only extended after the data write completes, so its last @<size>
+    marker is the size of the last complete array, whose closing "\\n]" the
+    torn append began overwriting.
+    """
+    try:
+        lines = index_path.read_bytes().splitlines()
+    except OSError:
+        return None
+    if not lines or not lines[-1].startswith(b"@"):
+        return None
+    end = int(lines[-1][1:]) - len(_ARRAY_TAIL)
+    if not 0 < end <= len(raw):
+        return None
+    try:
+        return orjson.loads(raw[:end] + _ARRAY_TAIL)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _write_array(path: Path, index_path: Path, items: list[dict]) -> None:
+    """Atomically rewrite the whole array and rebuild its id index."""
+    # orjson emits UTF-8 bytes with the same 2-space layout json.dump used
+    data = orjson.dumps(items, option=orjson.OPT_INDENT_2)
+    # Write beside the target and swap it in, so a crash mid-write leaves
+    # the previous array intact rather than a truncated file
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    _rebuild_index(index_path, (item.get("id") for item in items), len(data))
+
+
+def _append_to_array(path: Path, items: list[dict]) -> Optional[int]:
+    """
+    Splice items onto the end of the array at path, producing exactly the
+    bytes a full rewrite would. Returns the new file size, or None if the
+    file does not end like a non-empty indented array (caller rewrites).
+    """
+    body = orjson.dumps(items, option=orjson.OPT_INDENT_2)
+    try:
+        with open(path, "r+b") as f:
+            if f.seek(0, os.SEEK_END) < len(_ARRAY_TAIL) + 1:
+                return None
+            f.seek(-len(_ARRAY_TAIL), os.SEEK_END)
+            if f.read() != _ARRAY_TAIL:
+                return None
+            f.seek(-len(_ARRAY_TAIL), os.SEEK_END)
+            # body is b"[\n  {...}\n]": keep everything after the opening "["
+            f.write(b"," + body[1:])
+            return f.tell()
+    except OSError as exc:
+        log.warning("Could not append to %s: %s — rewriting", path, exc)
+        return None
+
+
+def _read_index(index_path: Path, path: Path) -> Optional[set[Any]]:
+    """Stored ids for path, or None if the index is missing or out of date."""
+    try:
+        lines = index_path.read_bytes().splitlines()
+        size  = path.stat().st_size
+    except OSError:
+        return None
+    if not lines or lines[-1] != b"@%d" % size:
+        return None
+    try:
+        return {orjson.loads(line) for line in lines if not line.startswith(b"@")}
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _rebuild_index(index_path: Path, ids: Iterable[Any], size: int) -> None:
+    index_path.unlink(missing_ok=True)
+    _append_index(index_path, ids, size)
+
+
+def _append_index(index_path: Path, ids: Iterable[Any], size: int) -> None:
+    lines = [orjson.dumps(i) + b"\n" for i in ids]
+    lines.append(b"@%d\n" % size)
+    with open(index_path, "ab") as f:
+        f.writelines(lines)
@@ -2,14 +2,17 @@
 Integration tests for Fetcher authentication injection.
 
 Verifies that each auth type reads the correct env vars, sets the right
-session headers, and handles OAuth2 token refresh properly.
+per-request headers, and handles OAuth2 token refresh properly.
 """
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from src.fetcher import Fetcher
+from src.fetcher import Fetcher, SessionPool
 
 
 GLOBAL_RETRY = {"max_attempts": 1, "backoff_factor": 1.0, "retry_on_status": []}
@@ -77,16 +80,16 @@ def _none_config():
 # ---------------------------------------------------------------------------
 
 class TestApiKeyAuth:
-    def test_api_key_header_set_on_session(self, monkeypatch):
+    def test_api_key_header_set(self, monkeypatch):
         monkeypatch.setenv("TEST_API_KEY", "secret-key-abc")
         fetcher = Fetcher(_api_key_config(), GLOBAL_RETRY)
-        assert fetcher._session.headers.get("X-API-Key") == "secret-key-abc"
+        assert fetcher._headers.get("X-API-Key") == "secret-key-abc"
 
     def test_custom_header_name(self, monkeypatch):
         monkeypatch.setenv("MOTORS_KEY", "motors-secret")
         config = _api_key_config(header="X-Motors-API-Key", env_var="MOTORS_KEY")
         fetcher = Fetcher(config, GLOBAL_RETRY)
-        assert fetcher._session.headers.get("X-Motors-API-Key") == "motors-secret"
+        assert fetcher._headers.get("X-Motors-API-Key") == "motors-secret"
 
     def test_missing_env_var_raises(self, monkeypatch):
         monkeypatch.delenv("TEST_API_KEY", raising=False)
@@ -102,7 +105,7 @@ class TestBearerAuth:
     def test_bearer_authorization_header_set(self, monkeypatch):
         monkeypatch.setenv("TEST_BEARER_TOKEN", "tok-xyz")
         fetcher = Fetcher(_bearer_config(), GLOBAL_RETRY)
-        assert fetcher._session.headers.get("Authorization") == "Bearer tok-xyz"
+        assert fetcher._headers.get("Authorization") == "Bearer tok-xyz"
 
     def test_missing_bearer_env_var_raises(self, monkeypatch):
         monkeypatch.delenv("TEST_BEARER_TOKEN", raising=False)
@@ -117,8 +120,8 @@ class TestBearerAuth:
 class TestNoAuth:
     def test_none_auth_sets_no_auth_headers(self):
         fetcher = Fetcher(_none_config(), GLOBAL_RETRY)
-        assert "Authorization" not in fetcher._session.headers
-        assert "X-API-Key" not in fetcher._session.headers
+        assert "Authorization" not in fetcher._headers
+        assert "X-API-Key" not in fetcher._headers
 
     def test_unknown_auth_type_raises(self):
         config = {**_none_config(), "auth": {"type": "magic_token"}}
@@ -145,12 +148,12 @@ class TestOAuth2Auth:
         assert data["client_secret"] == "client-secret"
         assert data["scope"] == "read:data"
 
-    def test_bearer_token_set_on_session(self, monkeypatch):
+    def test_bearer_token_set(self, monkeypatch):
         monkeypatch.setenv("TEST_CLIENT_ID", "cid")
         monkeypatch.setenv("TEST_CLIENT_SECRET", "csec")
         with patch("requests.post", return_value=_token_resp("the-token")):
             fetcher = Fetcher(_oauth2_config(), GLOBAL_RETRY)
-        assert fetcher._session.headers.get("Authorization") == "Bearer the-token"
+        assert fetcher._headers.get("Authorization") == "Bearer the-token"
 
     def test_token_expiry_stored_with_60s_margin(self, monkeypatch):
         monkeypatch.setenv("TEST_CLIENT_ID", "cid")
@@ -180,14 +183,14 @@ class TestOAuth2Auth:
 
         api_resp = MagicMock()
         api_resp.raise_for_status = MagicMock()
-        api_resp.json.return_value = {"lots": []}
+        api_resp.content = b'{"lots": []}'
 
         with patch("requests.post", side_effect=fake_post):
             fetcher._session.get = MagicMock(return_value=api_resp)
             fetcher.get("https://api.example.com/v1/lots")
 
         assert token_calls["n"] == 2  # initial + refresh
-        assert "Bearer token-2" == fetcher._session.headers.get("Authorization")
+        assert "Bearer token-2" == fetcher._headers.get("Authorization")
 
     def test_non_expired_token_not_refreshed(self, monkeypatch):
         monkeypatch.setenv("TEST_CLIENT_ID", "cid")
@@ -204,7 +207,7 @@ class TestOAuth2Auth:
 
         api_resp = MagicMock()
         api_resp.raise_for_status = MagicMock()
-        api_resp.json.return_value = {}
+        api_resp.content = b"{}"
         fetcher._session.get = MagicMock(return_value=api_resp)
 
         fetcher.get("https://api.example.com/v1/lots")
@@ -212,9 +215,156 @@ class TestOAuth2Auth:
 
         assert token_calls["n"] == 1  # only initial fetch
 
+    def test_concurrent_workers_refresh_expired_token_once(self, monkeypatch):
+        monkeypatch.setenv("TEST_CLIENT_ID", "cid")
+        monkeypatch.setenv("TEST_CLIENT_SECRET", "csec")
+
+        token_calls = {"n": 0}
+
+        def fake_post(*args, **kwargs):
+            token_calls["n"] += 1
+            time.sleep(0.05)  # hold the refresh open while other workers arrive
+            return _token_resp(f"token-{token_calls['n']}")
+
+        with patch("requests.post", side_effect=fake_post):
+            fetcher = Fetcher(_oauth2_config(), GLOBAL_RETRY)
+        fetcher._oauth2_expires_at = time.monotonic() - 1
+
+        api_resp = MagicMock()
+        api_resp.content = b"{}"
+        fetcher._session.get = MagicMock(return_value=api_resp)
+        start = threading.Barrier(4)
+
+        def worker(_):
+            start.wait()
+            fetcher.get("https://api.example.com/v1/lots")
+
+        with patch("requests.post", side_effect=fake_post):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(worker, range(4)))
+
+        assert token_calls["n"] == 2  # initial + a single refresh
+        assert fetcher._headers.get("Authorization") == "Bearer token-2"
+
+    def test_non_oauth2_site_never_fetches_token(self):
+        fetcher = Fetcher({**_oauth2_config(), "auth": {"type": "none"}}, GLOBAL_RETRY)
+        api_resp = MagicMock()
+        api_resp.raise_for_status = MagicMock()
+        api_resp.content = b"{}"
+        fetcher._session.get = MagicMock(return_value=api_resp)
+
+        with patch("requests.post") as token_post:
+            fetcher.get("https://api.example.com/v1/lots")
+
+        token_post.assert_not_called()
+
     def test_missing_client_id_raises(self, monkeypatch):
         monkeypatch.delenv("TEST_CLIENT_ID", raising=False)
         monkeypatch.setenv("TEST_CLIENT_SECRET", "csec")
         with pytest.raises(KeyError):
             with patch("requests.post", return_value=_token_resp()):
                 Fetcher(_oauth2_config(), GLOBAL_RETRY)
+
+
+# ---------------------------------------------------------------------------
+# Shared SessionPool
+# ---------------------------------------------------------------------------
+
+class TestSharedSessionPool:
+    def test_same_retry_policy_shares_session(self, monkeypatch):
+        monkeypatch.setenv("TEST_API_KEY", "k")
+        pool = SessionPool()
+        a = Fetcher(_none_config(), GLOBAL_RETRY, pool)
+        b = Fetcher(_api_key_config(), GLOBAL_RETRY, pool)
+        assert a._session is b._session
+
+    def test_different_retry_policy_still_shares_session(self):
+        # Retries are driven by Fetcher, so the session carries no policy
+        pool = SessionPool()
+        a = Fetcher(_none_config(), GLOBAL_RETRY, pool)
+        b = Fetcher({**_none_config(), "retry": {"max_attempts": 5}}, GLOBAL_RETRY, pool)
+        assert a._session is b._session
+
+    def test_auth_not_stored_on_shared_session(self, monkeypatch):
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "tok-xyz")
+        pool = SessionPool()
+        fetcher = Fetcher(_bearer_config(), GLOBAL_RETRY, pool)
+        assert "Authorization" not in fetcher._session.headers
+
+    def test_auth_headers_sent_per_request(self, monkeypatch):
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "tok-xyz")
+        fetcher = Fetcher(_bearer_config(), GLOBAL_RETRY, SessionPool())
+        api_resp = MagicMock()
+        api_resp.content = b"[]"
+        fetcher._session.get = MagicMock(return_value=api_resp)
+        fetcher.get("https://api.example.com/v1/lots")
+        sent = fetcher._session.get.call_args[1]["headers"]
+        assert sent["Authorization"] == "Bearer tok-xyz"
+
+    def test_caller_headers_merged_over_auth_headers(self, monkeypatch):
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "tok-xyz")
+        fetcher = Fetcher(_bearer_config(), GLOBAL_RETRY, SessionPool())
+        api_resp = MagicMock()
+        api_resp.content = b"[]"
+        fetcher._session.get = MagicMock(return_value=api_resp)
+        fetcher.get("https://api.example.com/v1/lots", headers={"Accept": "application/json"})
+        sent = fetcher._session.get.call_args[1]["headers"]
+        assert sent == {"Authorization": "Bearer tok-xyz", "Accept": "application/json"}
+        assert fetcher._headers == {"Authorization": "Bearer tok-xyz"}
+
+    def test_caller_auth_overrides_site_auth(self):
+        fetcher = Fetcher(_none_config(), GLOBAL_RETRY, SessionPool())
+        api_resp = MagicMock()
+        api_resp.content = b"[]"
+        fetcher._session.get = MagicMock(return_value=api_resp)
+        fetcher.get("https://api.example.com/v1/lots", auth=("u", "p"))
+        assert fetcher._session.get.call_args[1]["auth"] == ("u", "p")
+
+    def test_cookies_not_shared_between_sites(self):
+        pool = SessionPool()
+        a = Fetcher(_none_config(), GLOBAL_RETRY, pool)
+        b = Fetcher({**_none_config(), "name": "other_site"}, GLOBAL_RETRY, pool)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"[]"
+        resp.cookies.set("session", "site-a", domain="api.example.com")
+        a._session.get = MagicMock(return_value=resp)
+        a.get("https://api.example.com/v1/lots")
+        assert a._cookies.get("session") == "site-a"
+        assert b._cookies.get("session") is None
+        assert len(pool.get().cookies) == 0
+
+    def test_concurrent_workers_collect_all_cookies(self):
+        fetcher = Fetcher(_none_config(), GLOBAL_RETRY, SessionPool())
+        workers, pages = 4, 40
+        start = threading.Barrier(workers)
+        sent = []
+
+        def fake_get(url, headers=None, cookies=None, **kwargs):
+            sent.append(len(cookies))  # iterates the jar handed to requests
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = b"[]"
+            resp.cookies.set(f"page{url.rsplit('=', 1)[1]}", "1", domain="api.example.com")
+            return resp
+
+        fetcher._session.get = MagicMock(side_effect=fake_get)
+
+        def worker(offset):
+            start.wait()
+            for page in range(offset, pages, workers):
+                fetcher.get(f"https://api.example.com/v1/lots?page={page}")
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(worker, range(workers)))
+
+        assert len(sent) == pages
+        assert {c.name for c in fetcher._cookies} == {f"page{n}" for n in range(pages)}
+
+    def test_shared_session_refuses_response_cookies(self):
+        session = SessionPool().get()
+        req = requests.Request("GET", "https://api.example.com/v1/lots").prepare()
+        raw = MagicMock()
+        raw._original_response.msg.get_all.return_value = ["session=abc; Path=/"]
+        requests.cookies.extract_cookies_to_jar(session.cookies, req, raw)
+        assert len(session.cookies) == 0
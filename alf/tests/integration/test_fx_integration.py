@@ -224,3 +224,89 @@ class TestConversionCorrectness:
         fx = _provider("GBP")
         # _fetched_at is -inf but same-currency short-circuits before fetch
         assert fx.convert(99.99, "GBP") == 99.99
+
+
+# ---------------------------------------------------------------------------
+# Batch conversion in the clients
+# ---------------------------------------------------------------------------
+
+class TestBatchApplyFX:
+    def _records(self, *currencies):
+        from src.models import AuctionRecord
+        return [
+            AuctionRecord(
+                id=str(i), source="t", lot_id=None, url=None,
+                manufacturer="Porsche", model="911",
+                sold_price=100.0, reserve_price=None, start_price=50.0,
+                currency=ccy, auction_date="2024-03-15",
+            )
+            for i, ccy in enumerate(currencies)
+        ]
+
+    def test_prices_converted_per_record_currency(self):
+        from src.client import _apply_fx
+        fx = _provider()
+        _skip_fetch(fx, {"USD": 0.79, "EUR": 0.85})
+        records = self._records("USD", "EUR", "GBP")
+        _apply_fx(records, fx)
+        assert [r.sold_price_base for r in records] == [79.0, 85.0, 100.0]
+        assert records[0].start_price_base == 39.5
+        assert records[0].reserve_price_base is None
+        assert all(r.base_currency == "GBP" for r in records)
+
+    def test_rate_resolved_once_per_currency(self, monkeypatch):
+        from src.client import _apply_fx
+        fx = _provider()
+        _skip_fetch(fx, {"USD": 0.79})
+        lookups = []
+        original = fx.rate
+        monkeypatch.setattr(fx, "rate", lambda ccy: lookups.append(ccy) or original(ccy))
+        _apply_fx(self._records("USD", "USD", "USD", "XYZ", "XYZ"), fx)
+        assert lookups == ["USD", "XYZ"]
+
+    def test_priceless_records_skip_rate_lookup(self, monkeypatch):
+        from src.client import _apply_fx
+        fx = _provider()
+        _skip_fetch(fx, {"USD": 0.79})
+        records = self._records("USD", "XYZ")
+        for record in records:
+            record.sold_price = record.reserve_price = record.start_price = None
+        rate = MagicMock(side_effect=fx.rate)
+        monkeypatch.setattr(fx, "rate", rate)
+        _apply_fx(records, fx)
+        rate.assert_not_called()
+        assert all(r.sold_price_base is None and r.start_price_base is None for r in records)
+        assert all(r.base_currency == "GBP" for r in records)
+
+    def test_priceless_listing_skips_rate_lookup(self, monkeypatch):
+        from src.classifieds.client import _apply_fx
+        from src.classifieds.models import ClassifiedListing
+        fx = _provider()
+        _skip_fetch(fx, {"USD": 0.79})
+        listing = ClassifiedListing(
+            id="ad-1", source="t", manufacturer="VW", model="Golf", year=2019,
+            price=None, currency="XYZ", mileage=None, mileage_unit="miles",
+            condition=None, fuel_type=None, transmission=None, colour=None,
+            location=None, url=None, listed_date=None,
+        )
+        rate = MagicMock(side_effect=fx.rate)
+        monkeypatch.setattr(fx, "rate", rate)
+        _apply_fx([listing], fx)
+        rate.assert_not_called()
+        assert listing.price_base is None
+        assert listing.base_currency == "GBP"
+
+    def test_unknown_currency_leaves_base_prices_none(self):
+        from src.classifieds.client import _apply_fx
+        from src.classifieds.models import ClassifiedListing
+        fx = _provider()
+        _skip_fetch(fx, {"USD": 0.79})
+        listing = ClassifiedListing(
+            id="ad-1", source="t", manufacturer="VW", model="Golf", year=2019,
+            price=1000.0, currency="XYZ", mileage=None, mileage_unit="miles",
+            condition=None, fuel_type=None, transmission=None, colour=None,
+            location=None, url=None, listed_date=None,
+        )
+        _apply_fx([listing], fx)
+        assert listing.price_base is None
+        assert listing.base_currency == "GBP"
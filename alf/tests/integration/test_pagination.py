@@ -1,9 +1,11 @@
 """
 Integration tests for offset and cursor pagination edge cases.
 """
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.adapters.rest import RestAdapter
+from src.adapters.rest import RestAdapter, _Pagination
 
 from tests.integration.conftest import (
     AUCTION_SITE_CONFIG,
@@ -174,3 +176,60 @@ class TestCursorPagination:
         # With next_cursor present after empty page the loop continues — this is by design
         # Just verify no crash and fetcher called at most once
         assert records == []
+
+
+class TestConcurrentOffsetPagination:
+    """concurrency > 1 prefetches pages in parallel but must consume them in order."""
+
+    @staticmethod
+    def _paged_fetcher(pages):
+        """Fetcher whose get() answers by page number, independent of call order."""
+        fetcher = MagicMock()
+        fetcher.get.side_effect = lambda url, params: {"lots": pages.get(params["page"], [])}
+        return fetcher
+
+    def _config(self, concurrency, **kwargs):
+        config = _offset_config(**kwargs)
+        config["pagination"]["concurrency"] = concurrency
+        return config
+
+    def test_records_returned_in_page_order(self):
+        fetcher = self._paged_fetcher({
+            1: _items("1", "2"),
+            2: _items("3", "4"),
+            3: _items("5", "6"),
+            4: _items("7"),
+        })
+        records = RestAdapter(self._config(concurrency=3), fetcher).fetch()
+        assert [r.id for r in records] == ["1", "2", "3", "4", "5", "6", "7"]
+
+    def test_pages_after_short_page_are_discarded(self):
+        fetcher = self._paged_fetcher({
+            1: _items("1", "2"),
+            2: _items("3"),
+            3: _items("x", "y"),  # speculatively fetched, must be ignored
+        })
+        records = RestAdapter(self._config(concurrency=4), fetcher).fetch()
+        assert [r.id for r in records] == ["1", "2", "3"]
+
+    def test_max_pages_caps_speculative_requests(self):
+        fetcher = self._paged_fetcher({p: _items(f"{p}a", f"{p}b") for p in range(1, 20)})
+        records = RestAdapter(self._config(concurrency=4, max_pages=3), fetcher).fetch()
+        assert len(records) == 6
+        assert fetcher.get.call_count == 3
+
+
+class TestPaginationConfig:
+    def test_defaults_when_block_missing(self):
+        pag = _Pagination.from_config({})
+        assert pag.type == "none"
+        assert pag.page_param == "page"
+        assert pag.max_pages == 1000
+
+    def test_unknown_keys_ignored(self):
+        pag = _Pagination.from_config({"type": "cursor", "comment": "vendor docs v2"})
+        assert pag.type == "cursor"
+
+    def test_resolved_once_at_construction(self):
+        adapter = RestAdapter(_offset_config(step=50), make_fetcher())
+        assert adapter._pagination.offset_step == 50
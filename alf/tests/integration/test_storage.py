@@ -2,9 +2,10 @@
 Integration tests for AuctionStorage and ClassifiedStorage.
 
 Tests cover: file creation, correct path structure, JSON validity,
-deduplication, merge-with-existing, and concurrent writes.
+deduplication, merge-with-existing, in-place appends, and concurrent writes.
 """
 import json
+import shutil
 import threading
 
 import pytest
@@ -178,6 +179,15 @@ class TestAuctionStorage:
         data = json.loads(path.read_text())
         assert len(data) == 50
 
+    def test_many_partitions_written_in_one_save(self, tmp_path):
+        storage = AuctionStorage(str(tmp_path))
+        records = [_auction(id_=str(i), model=f"M{i}") for i in range(12)]
+        assert storage.save(records) == 12
+        for record in records:
+            mfr, mdl, date = record.storage_path_parts
+            data = json.loads((tmp_path / mfr / mdl / date / "auctions.json").read_text())
+            assert [r["id"] for r in data] == [record.id]
+
     def test_corrupted_existing_file_is_overwritten(self, tmp_path):
         storage = AuctionStorage(str(tmp_path))
         record = _auction()
@@ -190,6 +200,83 @@ class TestAuctionStorage:
         data = json.loads(path.read_text())
         assert len(data) == 1
 
+    def test_partition_dir_removed_while_running_is_recreated(self, tmp_path):
+        storage = AuctionStorage(str(tmp_path))
+        storage.save([_auction(id_="a")])
+        merge = storage._merge_and_write
+
+        def remove_dir_then_merge(path, records):
+            # Directory disappears after it was cached as ensured
+            shutil.rmtree(path.parent)
+            storage._merge_and_write = merge
+            return merge(path, records)
+
+        storage._merge_and_write = remove_dir_then_merge
+        assert storage.save([_auction(id_="b")]) == 1
+        mfr, mdl, date = _auction().storage_path_parts
+        data = json.loads((tmp_path / mfr / mdl / date / "auctions.json").read_text())
+        assert [r["id"] for r in data] == ["b"]
+
+
+class TestInPlaceAppend:
+    """Saves against an indexed file append without rewriting the array."""
+
+    def _path(self, tmp_path):
+        mfr, mdl, date = _auction().storage_path_parts
+        return tmp_path / mfr / mdl / date / "auctions.json"
+
+    def test_append_matches_full_rewrite(self, tmp_path):
+        records = [_auction(id_=i) for i in ("a", "b", "c")]
+        storage = AuctionStorage(str(tmp_path))
+        storage.save(records[:2])
+        storage.save(records[2:])
+        appended = self._path(tmp_path).read_bytes()
+
+        other = tmp_path / "fresh"
+        AuctionStorage(str(other)).save(records)
+        assert appended == self._path(other).read_bytes()
+
+    def test_index_dedups_across_saves(self, tmp_path):
+        storage = AuctionStorage(str(tmp_path))
+        storage.save([_auction(id_="a")])
+        assert storage.save([_auction(id_="a"), _auction(id_="b")]) == 1
+        ids = [r["id"] for r in json.loads(self._path(tmp_path).read_text())]
+        assert ids == ["a", "b"]
+
+    def test_external_rewrite_invalidates_index(self, tmp_path):
+        storage = AuctionStorage(str(tmp_path))
+        storage.save([_auction(id_="a")])
+        path = self._path(tmp_path)
+        # Another tool rewrites the array compactly; the index no longer matches
+        path.write_text(json.dumps([{"id": "x"}]))
+        assert storage.save([_auction(id_="a")]) == 1
+        ids = [r["id"] for r in json.loads(path.read_text())]
+        assert ids == ["x", "a"]
+
+    def test_torn_append_keeps_earlier_records(self, tmp_path):
+        storage = AuctionStorage(str(tmp_path))
+        storage.save([_auction(id_="a"), _auction(id_="b")])
+        path = self._path(tmp_path)
+        # Simulate a crash part-way through splicing the next record on
+        path.write_bytes(path.read_bytes()[:-2] + b',\n  {"id": "c", "sold')
+        assert storage.save([_auction(id_="d")]) == 1
+        ids = [r["id"] for r in json.loads(path.read_text())]
+        assert ids == ["a", "b", "d"]
+
+    def test_rewrite_leaves_no_temp_file(self, tmp_path):
+        AuctionStorage(str(tmp_path)).save([_auction()])
+        assert not self._path(tmp_path).with_suffix(".json.tmp").exists()
+
+    def test_unindexed_existing_file_is_merged(self, tmp_path):
+        path = self._path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps([{"id": "old"}], indent=2))
+        storage = AuctionStorage(str(tmp_path))
+        assert storage.save([_auction(id_="old"), _auction(id_="new")]) == 1
+        assert storage.save([_auction(id_="newer")]) == 1
+        ids = [r["id"] for r in json.loads(path.read_text())]
+        assert ids == ["old", "new", "newer"]
+
 
 # ---------------------------------------------------------------------------
 # ClassifiedStorage
@@ -5,47 +5,81 @@ Run with:  pytest tests/ -v
 """
 import pytest
 
-from src.adapters.rest import RestAdapter, _get_field, _to_date, _to_float
+from src.adapters.rest import (
+    RestAdapter,
+    _compile_mapping,
+    _to_currency,
+    _to_date,
+    _to_float,
+    _to_title,
+    _walk,
+)
 from src.classifieds.adapters.rest import _to_int
 
 
 # ---------------------------------------------------------------------------
-# _get_field
+# _walk over _compile_mapping paths
 # ---------------------------------------------------------------------------
 
-class TestGetField:
+def _lookup(item, mapping, canonical):
+    return _walk(item, _compile_mapping(mapping).get(canonical))
+
+
+class TestWalk:
     def test_simple_key(self):
         item = {"make": "Porsche"}
         mapping = {"manufacturer": "make"}
-        assert _get_field(item, mapping, "manufacturer") == "Porsche"
+        assert _lookup(item, mapping, "manufacturer") == "Porsche"
 
     def test_dot_notation_two_levels(self):
         item = {"price": {"value": 15000.0, "currency": "GBP"}}
         mapping = {"sold_price": "price.value"}
-        assert _get_field(item, mapping, "sold_price") == 15000.0
+        assert _lookup(item, mapping, "sold_price") == 15000.0
 
     def test_dot_notation_three_levels(self):
         item = {"a": {"b": {"c": 42}}}
         mapping = {"val": "a.b.c"}
-        assert _get_field(item, mapping, "val") == 42
+        assert _lookup(item, mapping, "val") == 42
 
     def test_missing_canonical_returns_none(self):
-        assert _get_field({}, {}, "sold_price") is None
+        assert _lookup({}, {}, "sold_price") is None
 
     def test_missing_path_segment_returns_none(self):
         item = {"price": None}
         mapping = {"sold_price": "price.value"}
-        assert _get_field(item, mapping, "sold_price") is None
+        assert _lookup(item, mapping, "sold_price") is None
 
     def test_non_dict_mid_path_returns_none(self):
         item = {"price": "flat_string"}
         mapping = {"sold_price": "price.value"}
-        assert _get_field(item, mapping, "sold_price") is None
+        assert _lookup(item, mapping, "sold_price") is None
 
     def test_key_absent_from_item(self):
         item = {"other": 1}
         mapping = {"sold_price": "hammer_price"}
-        assert _get_field(item, mapping, "sold_price") is None
+        assert _lookup(item, mapping, "sold_price") is None
+
+    def test_null_mapping_path_returns_none(self):
+        assert _lookup({"make": "Porsche"}, {"manufacturer": None}, "manufacturer") is None
+
+    def test_top_level_non_dict_returns_none(self):
+        assert _walk(["not", "a", "dict"], ("make",)) is None
+
+
+# ---------------------------------------------------------------------------
+# _compile_mapping
+# ---------------------------------------------------------------------------
+
+class TestCompileMapping:
+    def test_paths_split_into_tuples(self):
+        mapping = {"id": "itemId", "sold_price": "price.value"}
+        assert _compile_mapping(mapping) == {
+            "id": ("itemId",),
+            "sold_price": ("price", "value"),
+        }
+
+    def test_null_and_empty_paths_dropped(self):
+        assert _compile_mapping({"manufacturer": None, "model": ""}) == {}
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +106,29 @@ class TestToFloat:
         assert _to_float("") is None
 
 
+# ---------------------------------------------------------------------------
+# _to_title / _to_currency
+# ---------------------------------------------------------------------------
+
+class TestTextNormalisers:
+    def test_title_strips_and_title_cases(self):
+        assert _to_title("  land rover ") == "Land Rover"
+
+    def test_title_missing_is_empty(self):
+        assert _to_title(None) == ""
+        assert _to_title("") == ""
+
+    def test_title_non_string_coerced(self):
+        assert _to_title(911) == "911"
+
+    def test_currency_upper_cased(self):
+        assert _to_currency("eur") == "EUR"
+
+    def test_currency_defaults_to_gbp(self):
+        assert _to_currency(None) == "GBP"
+        assert _to_currency("") == "GBP"
+
+
 # ---------------------------------------------------------------------------
 # _to_int
 # ---------------------------------------------------------------------------
@@ -122,6 +179,16 @@ class TestToDate:
     def test_unparseable_returns_as_is(self):
         assert _to_date("not-a-date") == "not-a-date"
 
+    def test_single_digit_day_and_month(self):
+        assert _to_date("1/3/2024") == "2024-03-01"
+
+    def test_impossible_date_returns_as_is(self):
+        assert _to_date("31/02/2024") == "31/02/2024"
+
+    def test_mdy_hyphen_not_accepted(self):
+        # Only "/" dates fall back to month-first ordering
+        assert _to_date("03-15-2024") == "03-15-2024"
+
 
 # ---------------------------------------------------------------------------
 # RestAdapter._unwrap
@@ -194,8 +261,9 @@ class TestMapItem:
         adapter = RestAdapter.__new__(RestAdapter)
         adapter.config = cfg
         adapter._field_mapping = cfg["field_mapping"]
+        adapter._field_paths = _compile_mapping(cfg["field_mapping"])
         adapter._mapped_top_keys = frozenset(
-            v.split(".")[0] for v in cfg["field_mapping"].values() if v
+            parts[0] for parts in adapter._field_paths.values()
         )
         return adapter
 
@@ -210,7 +278,7 @@ class TestMapItem:
             "lotNum": "42",
             "extra_field": "kept",
         }
-        record = adapter._map_item(item, adapter.config["field_mapping"], "test_site")
+        record = adapter._map_item(item, adapter._field_paths, "test_site")
         assert record.id == "A123"
         assert record.manufacturer == "Porsche"
         assert record.model == "911"
@@ -231,7 +299,7 @@ class TestMapItem:
             "lotNum": None,
             "unmapped": "preserved",
         }
-        record = adapter._map_item(item, adapter.config["field_mapping"], "test_site")
+        record = adapter._map_item(item, adapter._field_paths, "test_site")
         # hammerPrice is the top-level key for a dot-path — must not appear in raw
         assert "hammerPrice" not in record.raw
         assert "auctionId" not in record.raw
@@ -242,7 +310,7 @@ class TestMapItem:
         item = {"auctionId": "C1", "make": "Ford", "model": "Mustang",
                 "hammerPrice": {"amount": 20000, "currency": "USD"},
                 "endDate": "2024-08-10", "lotNum": None}
-        record = adapter._map_item(item, adapter.config["field_mapping"], "test_site")
+        record = adapter._map_item(item, adapter._field_paths, "test_site")
         assert record.lot_id is None
 
     def test_manufacturer_title_cased(self):
@@ -250,6 +318,6 @@ class TestMapItem:
         item = {"auctionId": "D1", "make": "LAND ROVER", "model": "defender",
                 "hammerPrice": {"amount": 60000, "currency": "GBP"},
                 "endDate": "2024-09-01", "lotNum": "99"}
-        record = adapter._map_item(item, adapter.config["field_mapping"], "test_site")
+        record = adapter._map_item(item, adapter._field_paths, "test_site")
         assert record.manufacturer == "Land Rover"
         assert record.model == "Defender"
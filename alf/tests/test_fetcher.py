@@ -0,0 +1,133 @@
+"""
+Unit tests for Fetcher header-driven throttling and retries.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.fetcher import Fetcher
+
+
+class TestRateLimitHeaders:
+    """Fetcher._observe_rate_limit defers the bucket when the quota is exhausted."""
+
+    def _fetcher(self):
+        return Fetcher(
+            {"name": "t", "auth": {"type": "none"},
+             "rate_limit": {"requests_per_second": 1000.0, "burst": 10}},
+            {"max_attempts": 1},
+        )
+
+    def _response(self, headers):
+        resp = MagicMock()
+        resp.headers = headers
+        return resp
+
+    def test_exhausted_quota_defers_bucket(self):
+        fetcher = self._fetcher()
+        fetcher._bucket = MagicMock()
+        fetcher._observe_rate_limit(self._response(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+        ))
+        fetcher._bucket.defer.assert_called_once_with(12.0)
+
+    def test_epoch_reset_converted_to_delta(self):
+        fetcher = self._fetcher()
+        fetcher._bucket = MagicMock()
+        fetcher._observe_rate_limit(self._response(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 30)}
+        ))
+        (wait,), _ = fetcher._bucket.defer.call_args
+        assert 28 <= wait <= 30
+
+    def test_remaining_quota_does_not_defer(self):
+        fetcher = self._fetcher()
+        fetcher._bucket = MagicMock()
+        fetcher._observe_rate_limit(self._response(
+            {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "12"}
+        ))
+        fetcher._bucket.defer.assert_not_called()
+
+    def test_missing_headers_ignored(self):
+        fetcher = self._fetcher()
+        fetcher._bucket = MagicMock()
+        fetcher._observe_rate_limit(self._response({}))
+        fetcher._bucket.defer.assert_not_called()
+
+
+class TestRetry:
+    """Fetcher._send retries connection errors and retry_on_status responses."""
+
+    def _fetcher(self, max_attempts=2):
+        return Fetcher(
+            {"name": "t", "auth": {"type": "none"},
+             "rate_limit": {"requests_per_second": 1000.0, "burst": 10}},
+            {"max_attempts": max_attempts, "backoff_factor": 1.0,
+             "retry_on_status": [429, 503]},
+        )
+
+    def _response(self, status, content=b"{}", headers=None):
+        resp = MagicMock()
+        resp.status_code = status
+        resp.content = content
+        resp.headers = headers or {}
+        return resp
+
+    @patch("src.fetcher.time.sleep")
+    def test_retry_status_then_success(self, sleep):
+        fetcher = self._fetcher()
+        fetcher._session.get = MagicMock(side_effect=[
+            self._response(503), self._response(200, b'{"ok": true}'),
+        ])
+        assert fetcher.get("https://api.example.com/x") == {"ok": True}
+        assert fetcher._session.get.call_count == 2
+        sleep.assert_called_once()
+
+    @patch("src.fetcher.time.sleep")
+    def test_non_retry_status_returned_immediately(self, sleep):
+        fetcher = self._fetcher()
+        resp = self._response(404)
+        resp.raise_for_status.side_effect = requests.HTTPError("404")
+        fetcher._session.get = MagicMock(return_value=resp)
+        with pytest.raises(requests.HTTPError):
+            fetcher.get("https://api.example.com/x")
+        assert fetcher._session.get.call_count == 1
+        sleep.assert_not_called()
+
+    @patch("src.fetcher.time.sleep")
+    def test_connection_error_raised_after_last_attempt(self, sleep):
+        fetcher = self._fetcher(max_attempts=2)
+        fetcher._session.get = MagicMock(side_effect=requests.ConnectionError("down"))
+        with pytest.raises(requests.ConnectionError):
+            fetcher.get("https://api.example.com/x")
+        assert fetcher._session.get.call_count == 3  # first try + 2 retries
+        assert sleep.call_count == 2
+
+    @patch("src.fetcher.time.sleep")
+    def test_each_attempt_consumes_a_token(self, sleep):
+        fetcher = self._fetcher()
+        fetcher._bucket = MagicMock()
+        fetcher._session.get = MagicMock(side_effect=[
+            self._response(429), self._response(200),
+        ])
+        fetcher.get("https://api.example.com/x")
+        assert fetcher._bucket.consume.call_count == 2
+
+    @patch("src.fetcher.time.sleep")
+    def test_retry_after_header_extends_backoff(self, sleep):
+        fetcher = self._fetcher()
+        fetcher._session.get = MagicMock(side_effect=[
+            self._response(429, headers={"Retry-After": "30"}), self._response(200),
+        ])
+        fetcher.get("https://api.example.com/x")
+        (delay,), _ = sleep.call_args
+        assert delay == 30.0
+
+    def test_backoff_is_jittered_and_capped(self):
+        fetcher = self._fetcher()
+        delays = {fetcher._backoff(1) for _ in range(20)}
+        assert all(1.0 <= d <= 3.0 for d in delays)
+        assert len(delays) > 1
+        assert fetcher._backoff(20) <= 120.0
@@ -1,11 +1,12 @@
 """
-Unit tests for FXProvider conversion logic and retry-storm guard.
+Unit tests for FXProvider conversion logic, retry-storm guard and disk cache.
 """
+import os
 import time
 
 import pytest
 
-from src.fx import FXProvider
+from src.fx import FXProvider, get_fx_provider
 
 
 def _provider(base: str = "GBP", rates: dict | None = None) -> FXProvider:
@@ -87,3 +88,78 @@ class TestFXTTLGuard:
         t_before = time.monotonic()
         fx.convert(1.0, "USD")
         assert fx._fetched_at >= t_before
+
+
+class TestFXDiskCache:
+    CFG = {"base_currency": "GBP", "provider": "frankfurter", "api_key_env_var": None}
+
+    def _fetching_provider(self, tmp_path, monkeypatch, calls):
+        fx = FXProvider(self.CFG, data_dir=str(tmp_path))
+
+        def _fetch():
+            calls["n"] += 1
+            fx._rates = {"USD": 0.79}
+
+        monkeypatch.setattr(fx, "_fetch_frankfurter", _fetch)
+        return fx
+
+    def test_rates_written_to_cache(self, tmp_path, monkeypatch):
+        calls = {"n": 0}
+        fx = self._fetching_provider(tmp_path, monkeypatch, calls)
+        fx.convert(1.0, "USD")
+        assert (tmp_path / ".fx_cache" / "frankfurter_GBP.json").exists()
+
+    def test_fresh_cache_skips_network(self, tmp_path, monkeypatch):
+        calls = {"n": 0}
+        self._fetching_provider(tmp_path, monkeypatch, calls).convert(1.0, "USD")
+        second = self._fetching_provider(tmp_path, monkeypatch, calls)
+        assert second.convert(100.0, "USD") == 79.0
+        assert calls["n"] == 1
+
+    def test_stale_cache_refetched(self, tmp_path, monkeypatch):
+        calls = {"n": 0}
+        self._fetching_provider(tmp_path, monkeypatch, calls).convert(1.0, "USD")
+        monkeypatch.setattr(time, "time", lambda: 10**10)
+        self._fetching_provider(tmp_path, monkeypatch, calls).convert(1.0, "USD")
+        assert calls["n"] == 2
+
+    def test_corrupt_cache_ignored(self, tmp_path, monkeypatch):
+        cache = tmp_path / ".fx_cache" / "frankfurter_GBP.json"
+        cache.parent.mkdir()
+        cache.write_text("{not json")
+        calls = {"n": 0}
+        fx = self._fetching_provider(tmp_path, monkeypatch, calls)
+        assert fx.convert(100.0, "USD") == 79.0
+        assert calls["n"] == 1
+
+    def test_no_data_dir_disables_cache(self):
+        assert FXProvider(self.CFG)._cache_path is None
+
+    def test_failed_cache_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        calls = {"n": 0}
+        fx = self._fetching_provider(tmp_path, monkeypatch, calls)
+
+        def _fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", _fail_replace)
+        assert fx.convert(100.0, "USD") == 79.0
+        assert list((tmp_path / ".fx_cache").iterdir()) == []
+
+
+class TestSharedProvider:
+    CFG = {"enabled": True, "base_currency": "GBP", "provider": "frankfurter"}
+
+    def test_same_config_returns_same_instance(self):
+        assert get_fx_provider(dict(self.CFG)) is get_fx_provider(dict(self.CFG))
+
+    def test_key_order_does_not_matter(self):
+        reordered = dict(reversed(list(self.CFG.items())))
+        assert get_fx_provider(reordered) is get_fx_provider(self.CFG)
+
+    def test_different_config_returns_different_instance(self):
+        other = {**self.CFG, "base_currency": "EUR"}
+        assert get_fx_provider(other) is not get_fx_provider(self.CFG)
+
+    def test_data_dir_part_of_key(self, tmp_path):
+        assert get_fx_provider(self.CFG, str(tmp_path)) is not get_fx_provider(self.CFG)
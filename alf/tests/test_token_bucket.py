@@ -1,6 +1,7 @@
 """
 Unit tests for TokenBucket rate limiter.
 """
+import threading
 import time
 
 import pytest
@@ -40,3 +41,31 @@ class TestTokenBucket:
         bucket.consume()
         elapsed = time.monotonic() - start
         assert elapsed < 0.15, "Token should have accrued during sleep"
+
+    def test_concurrent_waiters_are_spaced_by_rate(self):
+        """Waiters queued on an empty bucket each get their own slot."""
+        bucket = TokenBucket(rate=20.0, burst=1)
+        bucket.consume()           # drain the burst
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.consume) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Four tokens at 20/s cannot all be granted in under ~0.2s
+        assert time.monotonic() - start >= 0.15
+
+    def test_defer_blocks_until_window_elapses(self):
+        bucket = TokenBucket(rate=100.0, burst=10)
+        bucket.defer(0.2)
+        start = time.monotonic()
+        bucket.consume()
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.15
+
+    def test_defer_zero_keeps_existing_tokens_usable(self):
+        bucket = TokenBucket(rate=1.0, burst=5)
+        bucket.defer(0.0)
+        start = time.monotonic()
+        bucket.consume()
+        assert time.monotonic() - start < 0.1
@@ -66,6 +66,9 @@ ISO_TS_RE   = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:")
 # ---------------------------------------------------------------------------
 
 class TestAuctionRecordSchema:
+    def test_slotted_no_instance_dict(self):
+        assert not hasattr(_auction(), "__dict__")
+
     def test_id_is_string(self):
         assert isinstance(_auction().id, str)
 
@@ -197,6 +200,9 @@ class TestAuctionRecordStoragePath:
 # ---------------------------------------------------------------------------
 
 class TestClassifiedListingSchema:
+    def test_slotted_no_instance_dict(self):
+        assert not hasattr(_listing(), "__dict__")
+
     def test_id_is_string(self):
         assert isinstance(_listing().id, str)
 
@@ -82,7 +82,7 @@ class BMWTDV6Engine:
         self.feed = EventFeed(self.bus, self.sensors, interval_ms=poll_interval_ms)
 
         # Reporting
-        self._report_gen = ReportGenerator(self.sensors, vehicle_id=vehicle_id)
+        self._report_gen = ReportGenerator(self.sensors, feed=self.feed, vehicle_id=vehicle_id)
 
         # Wire up default console logging for critical/warning events
         self.bus.subscribe(self._log_fault_event, EventType.FAULT_CODE_RAISED)
@@ -96,20 +96,23 @@ class BMWTDV6Engine:
     # ------------------------------------------------------------------ #
 
     def _log_fault_event(self, event: Event):
+        # %-style args: logging only formats the message if the record is emitted
+        data = event.data
         if event.severity == Severity.CRITICAL:
-            logger.critical(f'[FAULT] {event.source} — {event.data.get("code")} {event.data.get("description")}')
+            logger.critical('[FAULT] %s — %s %s', event.source, data.get('code'), data.get('description'))
         elif event.severity == Severity.WARNING:
-            logger.warning(f'[FAULT] {event.source} — {event.data.get("code")} {event.data.get("description")}')
+            logger.warning('[FAULT] %s — %s %s', event.source, data.get('code'), data.get('description'))
 
     def _log_threshold_event(self, event: Event):
-        sensor = event.data.get('sensor', event.source)
-        value = event.data.get('value')
-        unit = event.data.get('unit', '')
-        status = event.data.get('status', '')
+        data = event.data
+        sensor = data.get('sensor', event.source)
+        value = data.get('value')
+        unit = data.get('unit', '')
+        status = data.get('status', '')
         if event.severity == Severity.CRITICAL:
-            logger.critical(f'[THRESHOLD] {sensor}: {value} {unit} [{status.upper()}]')
+            logger.critical('[THRESHOLD] %s: %s %s [%s]', sensor, value, unit, status.upper())
         else:
-            logger.warning(f'[THRESHOLD] {sensor}: {value} {unit} [{status.upper()}]')
+            logger.warning('[THRESHOLD] %s: %s %s [%s]', sensor, value, unit, status.upper())
 
     # ------------------------------------------------------------------ #
     #  Lifecycle                                                           #
@@ -150,7 +153,9 @@ class BMWTDV6Engine:
 
     def snapshot(self, notes: str = ''):
         """Generate a one-shot diagnostic report from all sensors."""
-        return self._report_gen.generate(notes=notes)
+        report = self._report_gen.generate(notes=notes)
+        report.dropped_events = self.bus.dropped_count
+        return report
 
     def print_report(self, notes: str = ''):
         """Generate and immediately print a console report."""
@@ -213,7 +218,7 @@ class BMWTDV6Engine:
             while True:
                 time.sleep(report_interval_s)
                 cycle += 1
-                ts = __import__('datetime').datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                ts = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
                 base = output_path / f'{self.vehicle_id}_{ts}'
                 report = self.snapshot()
                 console_reporter.render(report)
@@ -6,70 +6,178 @@ Events are dispatched synchronously by default; async dispatch uses a
 background thread queue so the publisher never blocks.
 """
 import threading
-import queue
-from collections import defaultdict
-from typing import Callable, Optional
-from .types import Event, EventType
+from collections import defaultdict, deque
+from typing import Callable, Optional, Union
+from .types import Event, EventType, Severity
 from ..logging.logger import logger
 
 
+def _count_info(events: list[Event]) -> int:
+    return sum(e.severity is Severity.INFO for e in events)
+
+
 class EventBus:
-    def __init__(self, async_dispatch: bool = True):
+    def __init__(self, async_dispatch: bool = True, max_pending: int = 4096):
         self._subscribers: dict[Optional[EventType], list[Callable[[Event], None]]] = defaultdict(list)
+        # Per-type handlers with the wildcard subscribers appended, rebuilt and
+        # swapped in whole on (un)subscribe so dispatch does a single lookup
+        self._handlers: dict[EventType, tuple[Callable[[Event], None], ...]] = {}
+        self._subscribe_lock = threading.Lock()
         self._async = async_dispatch
-        self._queue: queue.Queue[Optional[Event]] = queue.Queue()
+        # Entries are single events, per-tick lists of events, or the None stop
+        # sentinel; the dispatch thread sleeps on _wake until there is work.
+        # _queue_lock guards the queue, the pending-event count and drop count.
+        self._queue: deque[Union[Event, list[Event], None]] = deque()
+        self._queue_lock = threading.Lock()
+        self._wake = threading.Event()
+        # Once more than max_pending events are waiting, the oldest queued INFO
+        # events are shed so a stalled handler can't grow the queue without
+        # bound. WARNING/CRITICAL events are never shed, so if only those are
+        # waiting the queue can still exceed max_pending. _info_pending counts
+        # the queued INFO events so shedding can stop at the last one it needs.
+        self._max_pending = max_pending
+        self._pending = 0
+        self._info_pending = 0
+        self._dropped = 0
+        self._backlog_warned = False
         self._dispatch_thread: Optional[threading.Thread] = None
-        self._running = False
 
         if async_dispatch:
             self._start_dispatch_thread()
 
     def _start_dispatch_thread(self):
-        self._running = True
         self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
         self._dispatch_thread.start()
 
     def _dispatch_loop(self):
-        while self._running:
-            try:
-                event = self._queue.get(timeout=0.1)
-                if event is None:
-                    break
-                self._dispatch_sync(event)
-                self._queue.task_done()
-            except queue.Empty:
-                continue
+        queue = self._queue
+        while True:
+            self._wake.wait()
+            # Clear before draining: a publish that lands mid-drain re-sets it
+            self._wake.clear()
+            while True:
+                with self._queue_lock:
+                    if not queue:
+                        break
+                    entry = queue.popleft()
+                    if entry is None:
+                        return
+                    if type(entry) is list:
+                        self._pending -= len(entry)
+                        self._info_pending -= _count_info(entry)
+                    else:
+                        self._pending -= 1
+                        self._info_pending -= entry.severity is Severity.INFO
+                if type(entry) is list:
+                    for e in entry:
+                        self._dispatch_sync(e)
+                else:
+                    self._dispatch_sync(entry)
 
     def _dispatch_sync(self, event: Event):
-        handlers = (
-            self._subscribers.get(event.event_type, [])
-            + self._subscribers.get(None, [])
-        )
-        for handler in handlers:
+        for handler in self._handlers.get(event.event_type, ()):
             try:
                 handler(event)
             except Exception as exc:
                 logger.error(f'EventBus handler error [{handler.__name__}]: {exc}')
 
+    def _enqueue(self, entry: Union[Event, list[Event]], count: int, info: int):
+        with self._queue_lock:
+            self._queue.append(entry)
+            self._pending += count
+            self._info_pending += info
+            if self._pending > self._max_pending and self._info_pending:
+                self._shed_info(self._pending - self._max_pending)
+            pending = self._pending
+            warn = False
+            if pending >= self._max_pending * 0.8:
+                warn = not self._backlog_warned
+                self._backlog_warned = True
+            elif pending < self._max_pending // 2:
+                self._backlog_warned = False
+        self._wake.set()
+        if warn:
+            logger.warning(f'EventBus backlog at {pending}/{self._max_pending} events — a handler may be stalled')
+
+    def _shed_info(self, excess: int):
+        """Drop up to `excess` of the oldest queued INFO events. Caller holds _queue_lock."""
+        queue = self._queue
+        kept: list[Union[Event, list[Event], None]] = []
+        # Stop at the last INFO event to shed rather than rotating the whole queue
+        target = min(excess, self._info_pending)
+        dropped = 0
+        while queue and dropped < target:
+            entry = queue.popleft()
+            if type(entry) is list:
+                remaining = []
+                for e in entry:
+                    if dropped < target and e.severity is Severity.INFO:
+                        dropped += 1
+                    else:
+                        remaining.append(e)
+                if remaining:
+                    kept.append(remaining)
+            elif entry is not None and entry.severity is Severity.INFO:
+                dropped += 1
+            else:
+                kept.append(entry)
+        # Put the surviving entries back at the front, in their original order
+        queue.extendleft(reversed(kept))
+        self._pending -= dropped
+        self._info_pending -= dropped
+        self._dropped += dropped
+
+    @property
+    def dropped_count(self) -> int:
+        """INFO events shed because the queue was over max_pending."""
+        return self._dropped
+
     def publish(self, event: Event):
         if self._async:
-            self._queue.put(event)
+            self._enqueue(event, 1, event.severity is Severity.INFO)
         else:
             self._dispatch_sync(event)
 
+    def publish_many(self, events: list[Event]):
+        """Publish a batch of events as a single queue entry and wake-up."""
+        if not events:
+            return
+        if self._async:
+            self._enqueue(events, len(events), _count_info(events))
+        else:
+            for event in events:
+                self._dispatch_sync(event)
+
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """True if publishing `event_type` would reach at least one handler."""
+        return bool(self._handlers.get(event_type))
+
     def subscribe(self, handler: Callable[[Event], None], event_type: Optional[EventType] = None):
         """Subscribe to a specific EventType, or None to receive all events."""
-        self._subscribers[event_type].append(handler)
+        with self._subscribe_lock:
+            self._subscribers[event_type].append(handler)
+            self._rebuild_handlers()
 
     def unsubscribe(self, handler: Callable[[Event], None], event_type: Optional[EventType] = None):
-        try:
-            self._subscribers[event_type].remove(handler)
-        except ValueError:
-            pass
+        with self._subscribe_lock:
+            try:
+                self._subscribers[event_type].remove(handler)
+            except ValueError:
+                return
+            self._rebuild_handlers()
+
+    def _rebuild_handlers(self):
+        wildcard = self._subscribers.get(None, [])
+        self._handlers = {
+            et: tuple(self._subscribers.get(et, [])) + tuple(wildcard)
+            for et in EventType
+        }
 
     def stop(self):
-        self._running = False
         if self._async:
-            self._queue.put(None)
+            # Sentinel goes behind anything already queued, so those still dispatch
+            with self._queue_lock:
+                self._queue.append(None)
+            self._wake.set()
             if self._dispatch_thread:
                 self._dispatch_thread.join(timeout=2)
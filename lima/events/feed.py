@@ -4,6 +4,7 @@ and publishes SensorReading events (and any fault code events) to the bus.
 """
 import threading
 import time
+from datetime import datetime
 from typing import Optional
 from .bus import EventBus
 from .types import Event, EventType, Severity
@@ -29,36 +30,58 @@ class EventFeed:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._tick_count = 0
+        # Readings from the last completed tick, keyed by sensor name, for
+        # consumers that want current values without triggering another read
+        self.latest: dict[str, SensorReading] = {}
+        # When that tick sampled the sensors and how long the poll took
+        self.last_poll_at: Optional[datetime] = None
+        self.last_poll_duration_s = 0.0
 
     def _poll_once(self):
         self._tick_count += 1
+        # Collect the whole tick's events and hand them to the bus in one put
+        batch: list[Event] = []
+        correlation_id = str(self._tick_count)
+        # Every event from one tick shares a single timestamp
+        tick_ts = datetime.utcnow()
+        # Only build events somebody will receive (checked once per tick)
+        has_subscribers = self._bus.has_subscribers
+        want_readings = has_subscribers(EventType.SENSOR_READING)
+        want_faults = has_subscribers(EventType.FAULT_CODE_RAISED)
+        want_breaches = has_subscribers(EventType.THRESHOLD_BREACH)
+        latest: dict[str, SensorReading] = {}
         for sensor in self._sensors:
             try:
                 reading: SensorReading = sensor.read()
+                latest[sensor.name] = reading
                 severity = _STATUS_SEVERITY.get(reading.status, Severity.INFO)
 
-                # Always publish the sensor reading event
-                self._bus.publish(Event(
-                    event_type=EventType.SENSOR_READING,
-                    source=sensor.name,
-                    severity=severity,
-                    data=reading.to_dict(),
-                    correlation_id=str(self._tick_count),
-                ))
-
-                # Publish individual fault code events
-                for fc in reading.fault_codes:
-                    self._bus.publish(Event(
-                        event_type=EventType.FAULT_CODE_RAISED,
+                # Publish the sensor reading event
+                if want_readings:
+                    batch.append(Event(
+                        event_type=EventType.SENSOR_READING,
                         source=sensor.name,
-                        severity=Severity(fc.severity) if fc.severity in ('info', 'warning', 'critical') else Severity.INFO,
-                        data=fc.to_dict(),
-                        correlation_id=str(self._tick_count),
+                        severity=severity,
+                        data=reading.to_dict(),
+                        timestamp=tick_ts,
+                        correlation_id=correlation_id,
                     ))
 
+                # Publish individual fault code events
+                if want_faults:
+                    for fc in reading.fault_codes:
+                        batch.append(Event(
+                            event_type=EventType.FAULT_CODE_RAISED,
+                            source=sensor.name,
+                            severity=_STATUS_SEVERITY.get(fc.severity, Severity.INFO),
+                            data=fc.to_dict(),
+                            timestamp=tick_ts,
+                            correlation_id=correlation_id,
+                        ))
+
                 # Publish threshold breach if status is not ok
-                if reading.status in ('warning', 'critical'):
-                    self._bus.publish(Event(
+                if want_breaches and reading.status in ('warning', 'critical'):
+                    batch.append(Event(
                         event_type=EventType.THRESHOLD_BREACH,
                         source=sensor.name,
                         severity=severity,
@@ -68,17 +91,31 @@ class EventFeed:
                             'unit': reading.unit,
                             'status': reading.status,
                         },
-                        correlation_id=str(self._tick_count),
+                        timestamp=tick_ts,
+                        correlation_id=correlation_id,
                     ))
 
             except Exception as exc:
                 logger.error(f'EventFeed poll error [{sensor.name}]: {exc}')
+        # Swap the whole tick in so readers never see a half-updated mix
+        self.latest = latest
+        self.last_poll_duration_s = (datetime.utcnow() - tick_ts).total_seconds()
+        self.last_poll_at = tick_ts
+        self._bus.publish_many(batch)
 
     def _run(self):
         logger.info('EventFeed started')
+        # Sleep to the next deadline rather than a fixed interval, so poll time
+        # doesn't stretch the cadence; after an overrun, restart from now
+        deadline = time.monotonic()
         while self._running:
             self._poll_once()
-            time.sleep(self._interval)
+            deadline += self._interval
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                deadline = time.monotonic()
         logger.info('EventFeed stopped')
 
     def start(self):
@@ -92,6 +129,10 @@ class EventFeed:
         if self._thread:
             self._thread.join(timeout=5)
 
+    @property
+    def running(self) -> bool:
+        return self._running
+
     @property
     def tick_count(self) -> int:
         return self._tick_count
@@ -1,8 +1,15 @@
+import itertools
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+# Event IDs are a random per-process prefix plus a sequence number: unique
+# across processes without paying for a uuid4 (os.urandom) per event.
+_EVENT_ID_PREFIX = uuid.uuid4().hex[:12]
+_EVENT_ID_COUNTER = itertools.count()
+
 
 class EventType(Enum):
     SENSOR_READING = 'sensor_reading'
@@ -24,7 +31,7 @@ class Severity(Enum):
     CRITICAL = 'critical'
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     event_type: EventType
     source: str
@@ -36,8 +43,7 @@ class Event:
 
     def __post_init__(self):
         if self.event_id is None:
-            import uuid
-            self.event_id = str(uuid.uuid4())
+            self.event_id = f'{_EVENT_ID_PREFIX}-{next(_EVENT_ID_COUNTER):08x}'
 
     def to_dict(self) -> dict:
         return {
@@ -11,10 +11,16 @@ class EngineTemperatureMonitor:
 
     def _monitor(self):
         logger.info('Engine temperature monitoring started')
+        deadline = time.monotonic()
         while self._running:
             temp = self.read_temperature_func()
             logger.info(f'Engine temperature: {temp}°C')
-            time.sleep(self.interval)
+            deadline += self.interval
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                deadline = time.monotonic()
 
     def start(self):
         if not self._running:
@@ -1,4 +1,4 @@
-from .report import DiagnosticReport, ReportGenerator
+from .report import DiagnosticReport, ReadingSource, ReportGenerator
 from . import console, json_reporter, html_reporter
 
-__all__ = ['DiagnosticReport', 'ReportGenerator', 'console', 'json_reporter', 'html_reporter']
+__all__ = ['DiagnosticReport', 'ReadingSource', 'ReportGenerator', 'console', 'json_reporter', 'html_reporter']
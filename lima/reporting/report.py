@@ -6,40 +6,64 @@ structured DiagnosticReport that can be rendered by any reporter.
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Protocol
 from ..sensors.base import BaseSensor, SensorReading, FaultCode
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticReport:
+    """
+    A snapshot of one poll. `readings` is read-only after construction: the
+    fault summary is derived from it once in __post_init__, so appending to
+    or reassigning it would leave fault_codes and the counts stale.
+    """
     vehicle_id: str
     generated_at: datetime
     readings: list[SensorReading]
     duration_s: float = 0.0
     notes: str = ''
+    dropped_events: int = 0
+    # Derived from `readings` in a single pass by __post_init__
+    _fault_codes: list[FaultCode] = field(init=False, repr=False, compare=False)
+    _critical_count: int = field(init=False, repr=False, compare=False)
+    _warning_count: int = field(init=False, repr=False, compare=False)
+    _overall_status: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        codes: list[FaultCode] = []
+        critical = warning = 0
+        status = 'OK'
+        for r in self.readings:
+            if r.status == 'critical':
+                status = 'CRITICAL'
+            elif r.status == 'warning' and status == 'OK':
+                status = 'WARNING'
+            for fc in r.fault_codes:
+                codes.append(fc)
+                if fc.severity == 'critical':
+                    critical += 1
+                elif fc.severity == 'warning':
+                    warning += 1
+        self._fault_codes = codes
+        self._critical_count = critical
+        self._warning_count = warning
+        self._overall_status = status
 
     @property
     def fault_codes(self) -> list[FaultCode]:
-        codes = []
-        for r in self.readings:
-            codes.extend(r.fault_codes)
-        return codes
+        return self._fault_codes
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for fc in self.fault_codes if fc.severity == 'critical')
+        return self._critical_count
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for fc in self.fault_codes if fc.severity == 'warning')
+        return self._warning_count
 
     @property
     def overall_status(self) -> str:
-        if any(r.status == 'critical' for r in self.readings):
-            return 'CRITICAL'
-        if any(r.status == 'warning' for r in self.readings):
-            return 'WARNING'
-        return 'OK'
+        return self._overall_status
 
     def to_dict(self) -> dict:
         return {
@@ -53,16 +77,55 @@ class DiagnosticReport:
                 'total': len(self.fault_codes),
             },
             'readings': [r.to_dict() for r in self.readings],
+            'dropped_events': self.dropped_events,
             'notes': self.notes,
         }
 
 
+class ReadingSource(Protocol):
+    """Anything that keeps the latest reading per sensor, e.g. an EventFeed."""
+
+    @property
+    def running(self) -> bool: ...
+
+    @property
+    def latest(self) -> dict[str, SensorReading]: ...
+
+    @property
+    def last_poll_at(self) -> Optional[datetime]: ...
+
+    @property
+    def last_poll_duration_s(self) -> float: ...
+
+
 class ReportGenerator:
-    def __init__(self, sensors: list[BaseSensor], vehicle_id: str = 'BMW-TDV6'):
+    def __init__(
+        self,
+        sensors: list[BaseSensor],
+        vehicle_id: str = 'BMW-TDV6',
+        feed: Optional[ReadingSource] = None,
+    ):
         self._sensors = sensors
+        self._feed = feed
         self._vehicle_id = vehicle_id
 
     def generate(self, notes: str = '') -> DiagnosticReport:
+        feed = self._feed
+        polled_at = feed.last_poll_at if feed is not None and feed.running else None
+        if polled_at is not None:
+            # The feed is already polling every sensor: report its last tick,
+            # stamped with when that tick sampled and how long it took. Sensors
+            # whose read failed on that tick are read directly.
+            latest = feed.latest
+            readings = [latest.get(sensor.name) or sensor.read() for sensor in self._sensors]
+            return DiagnosticReport(
+                vehicle_id=self._vehicle_id,
+                generated_at=polled_at,
+                readings=readings,
+                duration_s=feed.last_poll_duration_s,
+                notes=notes,
+            )
+
         start = datetime.utcnow()
         readings = [sensor.read() for sensor in self._sensors]
         end = datetime.utcnow()
@@ -2,8 +2,15 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 from datetime import datetime
 
+# Ordinal status levels: sensors classify (and escalate with max()) using
+# these, and _make_reading maps the level to SensorReading's status string
+STATUS_OK = 0
+STATUS_WARNING = 1
+STATUS_CRITICAL = 2
+STATUS_NAMES = ('ok', 'warning', 'critical')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FaultCode:
     code: str
     description: str
@@ -19,7 +26,7 @@ class FaultCode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     sensor_name: str
     value: Any
@@ -53,7 +60,7 @@ class BaseSensor:
     def _make_reading(
         self,
         value: Any,
-        status: str,
+        status: int,
         fault_codes: Optional[list[FaultCode]] = None,
         metadata: Optional[dict] = None,
     ) -> SensorReading:
@@ -61,7 +68,7 @@ class BaseSensor:
             sensor_name=self.name,
             value=value,
             unit=self.unit,
-            status=status,
+            status=STATUS_NAMES[status],
             fault_codes=fault_codes or [],
             metadata=metadata or {},
         )
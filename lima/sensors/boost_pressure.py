@@ -11,7 +11,7 @@ Common faults:
   P0236 - Turbocharger boost sensor A circuit range/performance
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 # Manifold absolute pressure (bar absolute)
 MAP_IDLE_MIN_BAR = 0.9
@@ -33,21 +33,20 @@ class BoostPressureSensor(BaseSensor):
         charge_air_temp_c = round(random.uniform(25, 75), 1)
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if actual_bar >= MAP_CRITICAL_HIGH_BAR:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0108', 'MAP pressure critically high', 'critical'))
         elif actual_bar > MAP_BOOST_MAX_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0106', 'MAP pressure above maximum boost spec', 'warning'))
         elif actual_bar < MAP_IDLE_MIN_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0107', 'MAP pressure below idle minimum — vacuum leak possible', 'warning'))
 
         if deviation > BOOST_DEVIATION_WARN_BAR:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P0236', f'Boost pressure deviation {deviation:.3f} bar from target', 'warning'))
 
         return self._make_reading(
@@ -9,7 +9,7 @@ Normal operating range: 85–105°C (thermostat opens ~88°C)
   P0128 - Coolant temperature below thermostat regulating temperature
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 COOLANT_LOW_C = 75
 COOLANT_WARN_C = 110
@@ -24,16 +24,16 @@ class CoolantTemperatureSensor(BaseSensor):
     def read(self) -> SensorReading:
         temp = round(random.uniform(50, 125), 1)
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if temp < COOLANT_LOW_C:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0128', 'Coolant temperature below thermostat regulating temp', 'warning'))
         elif temp >= COOLANT_CRITICAL_C:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0118', 'Coolant temperature critically high — check cooling system', 'critical'))
         elif temp >= COOLANT_WARN_C:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0116', 'Coolant temperature elevated', 'warning'))
 
         return self._make_reading(
@@ -9,7 +9,7 @@ Common faults:
   P244A - DPF restriction — ash accumulation level too high
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 DPF_SOOT_WARN_PCT = 70
 DPF_SOOT_REGEN_PCT = 80    # forced regen threshold
@@ -31,21 +31,20 @@ class DPFSensor(BaseSensor):
         ash_level_pct = round(random.uniform(0, 60), 1)
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if soot_pct >= DPF_SOOT_CRITICAL_PCT:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P2002', 'DPF soot level critical — immediate regeneration required', 'critical'))
         elif soot_pct >= DPF_SOOT_REGEN_PCT:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P2002', 'DPF soot load high — regeneration needed', 'warning'))
 
         if backpressure_mbar >= DPF_BACKPRESSURE_CRITICAL_MBAR:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P2453', 'DPF differential pressure critically high', 'critical'))
         elif backpressure_mbar >= DPF_BACKPRESSURE_WARN_MBAR:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P2452', 'DPF differential pressure elevated', 'warning'))
 
         if ash_level_pct > 45:
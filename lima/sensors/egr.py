@@ -11,7 +11,7 @@ Common faults on TDV6:
   P0405 - EGR position sensor circuit low
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING
 
 EGR_VALVE_STUCK_THRESHOLD_PCT = 5    # valve appears stuck if position delta < 5%
 EGR_FLOW_LOW_KGH = 0.5
@@ -30,18 +30,17 @@ class EGRSensor(BaseSensor):
         delta = abs(valve_position_pct - valve_target_pct)
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if flow_rate_kgh < EGR_FLOW_LOW_KGH and valve_position_pct > 20:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0401', 'EGR insufficient flow — valve may be coked/stuck', 'warning'))
         elif flow_rate_kgh > EGR_FLOW_HIGH_KGH:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0402', 'EGR excessive flow detected', 'warning'))
 
         if delta > 25:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P0404', 'EGR valve position deviation from target', 'warning'))
 
         return self._make_reading(
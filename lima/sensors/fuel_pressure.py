@@ -11,7 +11,7 @@ Common faults:
   P1093 - Fuel rail pressure too low during regeneration
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 RAIL_PRESSURE_MIN_BAR = 300
 RAIL_PRESSURE_IDLE_BAR = 350
@@ -33,24 +33,23 @@ class FuelPressureSensor(BaseSensor):
         pump_control_pct = round(random.uniform(20, 95), 1)
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if rail_pressure_bar <= RAIL_PRESSURE_CRITICAL_LOW_BAR:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0087', 'Fuel rail pressure critically low — HP pump failure likely', 'critical'))
         elif rail_pressure_bar < RAIL_PRESSURE_MIN_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0087', 'Fuel rail pressure low', 'warning'))
         elif rail_pressure_bar >= RAIL_PRESSURE_CRITICAL_HIGH_BAR:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0088', 'Fuel rail pressure critically high — pressure relief risk', 'critical'))
         elif rail_pressure_bar > RAIL_PRESSURE_MAX_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0088', 'Fuel rail pressure above maximum', 'warning'))
 
         if low_pressure_bar < LOW_PRESSURE_CIRCUIT_MIN_BAR:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P0190', 'Low pressure circuit below spec — check lift pump / filter', 'warning'))
 
         return self._make_reading(
@@ -8,7 +8,7 @@ Common faults:
   P0671–P0676 - Glow plug circuit open/short cylinders 1–6
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 CYLINDER_COUNT = 6
 GLOW_PLUG_NOMINAL_OHMS = 0.5
@@ -20,22 +20,21 @@ FAULT_CODES_BY_CYLINDER = {
     4: 'P0674', 5: 'P0675', 6: 'P0676',
 }
 
+# Metadata keys for the per-cylinder values, in cylinder order
+_CYLINDER_KEYS = tuple(f'cylinder_{i}' for i in range(1, CYLINDER_COUNT + 1))
+
 
 class GlowPlugSensor(BaseSensor):
     name = 'glow_plugs'
     unit = 'Ω'
 
     def read(self) -> SensorReading:
-        resistances = {
-            f'cylinder_{i}': round(random.uniform(0.3, 6.0), 2)
-            for i in range(1, CYLINDER_COUNT + 1)
-        }
+        resistances = [round(random.uniform(0.3, 6.0), 2) for _ in range(CYLINDER_COUNT)]
         fault_codes = []
         failed_cylinders = []
         warn_cylinders = []
 
-        for i in range(1, CYLINDER_COUNT + 1):
-            r = resistances[f'cylinder_{i}']
+        for i, r in enumerate(resistances, start=1):
             if r >= GLOW_PLUG_FAILED_OHMS:
                 failed_cylinders.append(i)
                 fault_codes.append(FaultCode(
@@ -52,20 +51,20 @@ class GlowPlugSensor(BaseSensor):
                 ))
 
         if failed_cylinders:
-            status = 'critical'
+            status = STATUS_CRITICAL
         elif warn_cylinders:
-            status = 'warning'
+            status = STATUS_WARNING
         else:
-            status = 'ok'
+            status = STATUS_OK
 
-        avg_resistance = round(sum(resistances.values()) / CYLINDER_COUNT, 2)
+        avg_resistance = round(sum(resistances) / CYLINDER_COUNT, 2)
 
         return self._make_reading(
             value=avg_resistance,
             status=status,
             fault_codes=fault_codes,
             metadata={
-                'resistances_ohm': resistances,
+                'resistances_ohm': dict(zip(_CYLINDER_KEYS, resistances)),
                 'failed_cylinders': failed_cylinders,
                 'warn_cylinders': warn_cylinders,
                 'nominal_resistance_ohm': GLOW_PLUG_NOMINAL_OHMS,
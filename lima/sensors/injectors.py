@@ -11,7 +11,7 @@ Common faults:
   P1141–P1146 - Injector balance rate out of range per cylinder (BMW-specific)
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 CYLINDER_COUNT = 6
 BALANCE_RATE_WARN_MG = 3.0    # mg/stroke deviation from zero
@@ -25,16 +25,16 @@ BALANCE_RATE_CODES = {
     4: 'P1144', 5: 'P1145', 6: 'P1146',
 }
 
+# Metadata keys for the per-cylinder values, in cylinder order
+_CYLINDER_KEYS = tuple(f'cylinder_{i}' for i in range(1, CYLINDER_COUNT + 1))
+
 
 class InjectorSensor(BaseSensor):
     name = 'injectors'
     unit = 'mg/stroke'
 
     def read(self) -> SensorReading:
-        balance_rates = {
-            f'cylinder_{i}': round(random.uniform(-8, 8), 2)
-            for i in range(1, CYLINDER_COUNT + 1)
-        }
+        balance_rates = [round(random.uniform(-8, 8), 2) for _ in range(CYLINDER_COUNT)]
         injection_quantity_mg = round(random.uniform(5, 60), 1)
         pilot_injection_active = random.choice([True, False])
 
@@ -42,8 +42,7 @@ class InjectorSensor(BaseSensor):
         critical_cyls = []
         warn_cyls = []
 
-        for i in range(1, CYLINDER_COUNT + 1):
-            rate = balance_rates[f'cylinder_{i}']
+        for i, rate in enumerate(balance_rates, start=1):
             abs_rate = abs(rate)
             if abs_rate >= BALANCE_RATE_CRITICAL_MG:
                 critical_cyls.append(i)
@@ -62,20 +61,20 @@ class InjectorSensor(BaseSensor):
                 ))
 
         if critical_cyls:
-            status = 'critical'
+            status = STATUS_CRITICAL
         elif warn_cyls:
-            status = 'warning'
+            status = STATUS_WARNING
         else:
-            status = 'ok'
+            status = STATUS_OK
 
-        avg_balance = round(sum(balance_rates.values()) / CYLINDER_COUNT, 2)
+        avg_balance = round(sum(balance_rates) / CYLINDER_COUNT, 2)
 
         return self._make_reading(
             value=avg_balance,
             status=status,
             fault_codes=fault_codes,
             metadata={
-                'balance_rates_mg': balance_rates,
+                'balance_rates_mg': dict(zip(_CYLINDER_KEYS, balance_rates)),
                 'injection_quantity_mg': injection_quantity_mg,
                 'pilot_injection_active': pilot_injection_active,
                 'critical_cylinders': critical_cyls,
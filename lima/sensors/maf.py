@@ -10,7 +10,8 @@ Common faults:
   P0103 - MAF circuit high input
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from functools import lru_cache
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 MAF_IDLE_MIN_GS = 15
 MAF_IDLE_MAX_GS = 40
@@ -23,6 +24,12 @@ IAT_WARN_C = 60
 IAT_CRITICAL_C = 80
 
 
+@lru_cache(maxsize=1024)
+def _air_density(intake_air_temp_c: float) -> float:
+    # IAT is rounded to 0.1 °C before it gets here, so only a few hundred keys occur
+    return round(1.225 * (273.15 / (273.15 + intake_air_temp_c)), 3)
+
+
 class MAFSensor(BaseSensor):
     name = 'maf'
     unit = 'g/s'
@@ -30,27 +37,26 @@ class MAFSensor(BaseSensor):
     def read(self) -> SensorReading:
         maf_gs = round(random.uniform(3, 460), 1)
         intake_air_temp_c = round(random.uniform(15, 85), 1)
-        air_density = round(1.225 * (273.15 / (273.15 + intake_air_temp_c)), 3)
+        air_density = _air_density(intake_air_temp_c)
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if maf_gs < MAF_CRITICAL_LOW_GS:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0102', 'MAF reading critically low — sensor may be failed or disconnected', 'critical'))
         elif maf_gs > MAF_CRITICAL_HIGH_GS:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0103', 'MAF reading critically high — sensor fault', 'critical'))
         elif maf_gs < MAF_IDLE_MIN_GS:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0101', 'MAF reading below idle minimum — check for air leaks or dirty sensor', 'warning'))
         elif maf_gs > MAF_LOAD_MAX_GS:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0103', 'MAF reading above maximum load value', 'warning'))
 
         if intake_air_temp_c >= IAT_CRITICAL_C:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P0113', 'Intake air temperature critically high — check intercooler', 'warning'))
 
         return self._make_reading(
@@ -11,7 +11,7 @@ Common faults:
   P229F - NOx sensor (bank 2) — downstream
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 # NOx thresholds (ppm) — Euro 5: 180 ppm, Euro 6: 80 ppm
 NOX_EURO5_LIMIT_PPM = 180
@@ -37,20 +37,19 @@ class NOxSensor(BaseSensor):
         )
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if nox_downstream_ppm >= NOX_CRITICAL_PPM:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P2200', f'NOx critically high ({nox_downstream_ppm:.0f} ppm) — emissions system failure', 'critical'))
         elif nox_downstream_ppm >= NOX_WARN_PPM:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P2201', f'NOx above Euro 5 limit ({nox_downstream_ppm:.0f} ppm)', 'warning'))
         elif nox_downstream_ppm >= NOX_EURO6_LIMIT_PPM:
             fault_codes.append(FaultCode('P229F', f'NOx above Euro 6 limit ({nox_downstream_ppm:.0f} ppm)', 'info'))
 
         if lambda_value < LAMBDA_RICH_WARN:
-            if status != 'critical':
-                status = 'warning'
+            status = max(status, STATUS_WARNING)
             fault_codes.append(FaultCode('P0130', f'Lambda rich condition ({lambda_value:.3f}) — unburnt fuel in exhaust', 'warning'))
         elif lambda_value > LAMBDA_LEAN_WARN:
             fault_codes.append(FaultCode('P0136', f'Lambda excessively lean ({lambda_value:.3f})', 'info'))
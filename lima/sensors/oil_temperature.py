@@ -7,7 +7,7 @@ Normal operating range: 80–130°C
   P0198 - Oil temperature too high
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 OIL_TEMP_LOW_C = 60
 OIL_TEMP_WARN_C = 130
@@ -21,16 +21,16 @@ class OilTemperatureSensor(BaseSensor):
     def read(self) -> SensorReading:
         temp = round(random.uniform(55, 155), 1)
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if temp < OIL_TEMP_LOW_C:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0197', 'Oil temperature too low — engine not at operating temp', 'warning'))
         elif temp >= OIL_TEMP_CRITICAL_C:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0198', 'Oil temperature critically high — risk of engine damage', 'critical'))
         elif temp >= OIL_TEMP_WARN_C:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0196', 'Oil temperature elevated', 'warning'))
 
         return self._make_reading(
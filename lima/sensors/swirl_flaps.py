@@ -13,7 +13,7 @@ Common faults:
   P2007 - Intake manifold runner control stuck closed (bank 2)
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 FLAP_BANKS = ['bank_1', 'bank_2']
 FLAP_STUCK_THRESHOLD_PCT = 5     # deviation < threshold when commanded to move = stuck
@@ -39,7 +39,7 @@ class SwirlFlapSensor(BaseSensor):
             }
 
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         for bank, data in banks.items():
             bank_num = '1' if bank == 'bank_1' else '2'
@@ -47,7 +47,7 @@ class SwirlFlapSensor(BaseSensor):
             torque = data['spindle_torque_nm']
 
             if deviation > 20:
-                status = 'critical'
+                status = STATUS_CRITICAL
                 stuck_open = data['actual_pct'] > 50
                 code = f'P200{"4" if stuck_open else "6"}' if bank == 'bank_1' else f'P200{"5" if stuck_open else "7"}'
                 fault_codes.append(FaultCode(
@@ -56,8 +56,7 @@ class SwirlFlapSensor(BaseSensor):
                     'critical',
                 ))
             elif deviation > FLAP_STUCK_THRESHOLD_PCT:
-                if status != 'critical':
-                    status = 'warning'
+                status = max(status, STATUS_WARNING)
                 fault_codes.append(FaultCode(
                     'P1530',
                     f'Swirl flap {bank} position deviation {deviation:.1f}% from commanded',
@@ -70,8 +69,7 @@ class SwirlFlapSensor(BaseSensor):
                     f'Swirl flap {bank} spindle torque elevated ({torque:.3f} Nm) — spindle seizure warning',
                     'warning',
                 ))
-                if status != 'critical':
-                    status = 'warning'
+                status = max(status, STATUS_WARNING)
 
         avg_position = round(
             sum(b['actual_pct'] for b in banks.values()) / len(FLAP_BANKS), 1
@@ -8,7 +8,7 @@ The TDV6 uses a variable-geometry turbocharger (VGT). Common faults:
   P0045 - Turbo/supercharger boost control solenoid circuit open
 """
 import random
-from .base import BaseSensor, FaultCode, SensorReading
+from .base import BaseSensor, FaultCode, SensorReading, STATUS_OK, STATUS_WARNING, STATUS_CRITICAL
 
 # BMW TDV6 boost pressure thresholds (bar absolute)
 BOOST_MIN_BAR = 1.4   # minimum expected under load
@@ -28,20 +28,20 @@ class TurbochargerSensor(BaseSensor):
         boost_bar = round(random.uniform(1.2, 2.7), 2)
         vane_position_pct = round(random.uniform(10, 90), 1)
         fault_codes = []
-        status = 'ok'
+        status = STATUS_OK
 
         if boost_bar < BOOST_MIN_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
             fault_codes.append(FaultCode('P0299', 'Turbocharger underboost condition', 'warning'))
         elif boost_bar > BOOST_OVERBOOST_BAR:
-            status = 'critical'
+            status = STATUS_CRITICAL
             fault_codes.append(FaultCode('P0234', 'Turbocharger overboost condition', 'critical'))
         elif boost_bar > BOOST_MAX_BAR:
-            status = 'warning'
+            status = STATUS_WARNING
 
         if not (VANE_MIN_PCT < vane_position_pct < VANE_MAX_PCT):
             fault_codes.append(FaultCode('P2563', 'VGT vane position out of range', 'warning'))
-            status = max(status, 'warning')
+            status = max(status, STATUS_WARNING)
 
         return self._make_reading(
             value=boost_bar,